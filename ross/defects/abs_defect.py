@@ -82,9 +82,9 @@ class Defect(ABC):
             amp, freq = self._dfft(probe_resp, self.dt)
 
             if range_freq is not None:
-                amp = amp[(freq >= range_freq[0]) & (freq <= range_freq[1])]
-
-                freq = freq[(freq >= range_freq[0]) & (freq <= range_freq[1])]
+                in_range = (freq >= range_freq[0]) & (freq <= range_freq[1])
+                amp = amp[in_range]
+                freq = freq[in_range]
 
             fig.add_trace(
                 go.Scatter(
@@ -127,14 +127,11 @@ class Defect(ABC):
         """
         b = np.floor(len(x) / 2)
         c = len(x)
-        df = 1 / (c * dt)
 
-        x_amp = sp.fft.fft(x)[: int(b)]
-        x_amp = x_amp * 2 / c
-        x_phase = np.angle(x_amp)
-        x_amp = np.abs(x_amp)
+        # The response is real, so only the non-negative frequencies are
+        # computed
+        x_amp = np.abs(sp.fft.rfft(x)[: int(b)]) * 2 / c
 
-        freq = np.arange(0, df * b, df)
-        freq = freq[: int(b)]  # Frequency vector
+        freq = sp.fft.rfftfreq(c, dt)[: int(b)]  # Frequency vector
 
         return x_amp, freq
@@ -1,8 +1,14 @@
+import math
 import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
 import numpy as np
 from numpy.linalg import pinv
-from scipy.optimize import curve_fit, minimize
+from scipy.optimize import curve_fit, least_squares, minimize
+from scipy.sparse import csr_matrix
+from scipy.sparse.linalg import spsolve
 
 from ross.bearing_seal_element import BearingElement
 from ross.units import Q_, check_units
@@ -44,6 +50,13 @@ class THDCylindrical(BearingElement):
     print_time : bool
         Set it True to print the time at the end.
         False by default.
+    workers : int, optional
+        Number of processes used to evaluate the perturbed force fields of
+        the perturbation method. Worth it only for fine meshes, since each
+        process has to start its own interpreter. Default is 1.
+    equilibrium_method : str, optional
+        Optimization method used to find the equilibrium position. See run for
+        the options. Default is "trf".
 
     Operation conditions
     ^^^^^^^^^^^^^^^^^^^^
@@ -79,7 +92,7 @@ class THDCylindrical(BearingElement):
     Reyn : Array
         The Reynolds number is a dimensionless number used to calculate the
         fluid flow regime inside the bearing.
-    delta_turb : float
+    delta_turb : array
         Eddy viscosity scaling factor. Coefficient to assign weight to laminar,
         transitional and turbulent flows to calculate viscosity.
 
@@ -106,6 +119,7 @@ class THDCylindrical(BearingElement):
     ----------
     Pdim : array
         Dimensional pressure field. The unit is pascal.
+        Its shape is: (n_pad, elements_axial, elements_circumferential)
     dPdz : array
         Differential pressure field in z direction.
     dPdy : array
@@ -125,7 +139,7 @@ class THDCylindrical(BearingElement):
     >>> from ross.fluid_flow.cylindrical import cylindrical_bearing_example
     >>> bearing = cylindrical_bearing_example()
     >>> bearing.equilibrium_pos
-    array([ 0.60678516, -0.73288691])
+    array([ 0.60678517, -0.73288688])
     """
 
     @check_units
@@ -154,6 +168,8 @@ class THDCylindrical(BearingElement):
         print_result=False,
         print_progress=False,
         print_time=False,
+        workers=1,
+        equilibrium_method="trf",
     ):
 
         self.axial_length = axial_length
@@ -177,6 +193,8 @@ class THDCylindrical(BearingElement):
         self.print_result = print_result
         self.print_progress = print_progress
         self.print_time = print_time
+        self.workers = workers
+        self.equilibrium_method = equilibrium_method
 
         if self.n_y == None:
             self.n_y = self.elements_circumferential
@@ -184,9 +202,53 @@ class THDCylindrical(BearingElement):
         self.betha_s_dg = pad_arc_length
         self.betha_s = pad_arc_length * np.pi / 180
 
-        self.thetaI = 0
-        self.thetaF = self.betha_s
-        self.dtheta = (self.thetaF - self.thetaI) / (self.elements_circumferential)
+        self.dtheta = self.betha_s / self.elements_circumferential
+
+        # Pad angular positions
+
+        self.pad_ct = [ang for ang in range(0, 360, int(360 / self.n_pad))]
+
+        self.thetaI = np.radians(
+            [pad + (180 / self.n_pad) - (self.betha_s_dg / 2) for pad in self.pad_ct]
+        )
+
+        self.thetaF = np.radians(
+            [pad + (180 / self.n_pad) + (self.betha_s_dg / 2) for pad in self.pad_ct]
+        )
+
+        self._Ytheta = np.array(
+            [
+                np.linspace(t1, t2, self.elements_circumferential)
+                for t1, t2 in zip(self.thetaI, self.thetaF)
+            ]
+        )
+        self._cos_Ytheta = np.cos(self._Ytheta)
+        self._sin_Ytheta = np.sin(self._Ytheta)
+
+        # Angular position of the control volume centers of each pad
+
+        self._Ytheta_c = np.array(
+            [
+                np.arange(t1 + (self.dtheta / 2), t2, self.dtheta)
+                for t1, t2 in zip(self.thetaI, self.thetaF)
+            ]
+        )
+
+        # Trigonometric tables of each pad, at the control volume centers and
+        # at the east and west faces. Their shape is (n_pad, 6, n_theta).
+
+        theta = self._Ytheta_c
+        self._trig_tables = np.stack(
+            (
+                np.cos(theta),
+                np.sin(theta),
+                np.cos(theta + 0.5 * self.dtheta),
+                np.sin(theta + 0.5 * self.dtheta),
+                np.cos(theta - 0.5 * self.dtheta),
+                np.sin(theta - 0.5 * self.dtheta),
+            ),
+            axis=1,
+        )
 
         ##
         # Dimensionless discretization variables
@@ -214,6 +276,16 @@ class THDCylindrical(BearingElement):
 
         self.Zdim = self.Z * self.axial_length
 
+        # Sparsity pattern shared by the pressure and temperature systems, and
+        # block diagonal pattern of the systems of all pads solved together
+
+        self._pattern = _stencil_pattern(
+            self.elements_axial, self.elements_circumferential
+        )
+        self._pad_pattern = _stencil_pattern(
+            self.elements_axial, self.elements_circumferential, self.n_pad
+        )
+
         self.lubricant_dict = {
             "ISOVG32": {
                 "viscosity1": Q_(4.05640e-06, "reyn").to_base_units().m,
@@ -322,12 +394,12 @@ class THDCylindrical(BearingElement):
             xr = (
                 self.initial_guess[0]
                 * self.radial_clearance
-                * np.cos(self.initial_guess[1])
+                * math.cos(self.initial_guess[1])
             )
             yr = (
                 self.initial_guess[0]
                 * self.radial_clearance
-                * np.sin(self.initial_guess[1])
+                * math.sin(self.initial_guess[1])
             )
             self.Y = yr / self.radial_clearance
             self.X = xr / self.radial_clearance
@@ -346,56 +418,72 @@ class THDCylindrical(BearingElement):
         T_mist = self.reference_temperature * np.ones(self.n_pad)
 
         Reyn = np.zeros(
-            (self.elements_axial, self.elements_circumferential, self.n_pad)
+            (self.n_pad, self.elements_axial, self.elements_circumferential)
         )
 
-        pad_ct = [ang for ang in range(0, 360, int(360 / self.n_pad))]
-
-        self.thetaI = np.radians(
-            [pad + (180 / self.n_pad) - (self.betha_s_dg / 2) for pad in pad_ct]
-        )
+        # Constant factors of the finite volume coefficients
 
-        self.thetaF = np.radians(
-            [pad + (180 / self.n_pad) + (self.betha_s_dg / 2) for pad in pad_ct]
-        )
+        R2 = self.journal_radius**2
+        L2 = self.axial_length**2
+        betha_s2 = self.betha_s**2
+        dY_dZ = self.dY * self.dZ
+        dy_dZ = self.dy * self.dZ
+        rho_Cp = self.rho * self.Cp
 
-        Ytheta = [
-            np.linspace(t1, t2, self.elements_circumferential)
-            for t1, t2 in zip(self.thetaI, self.thetaF)
-        ]
+        coef_EW = self.dZ / (12 * self.dY * betha_s2)
+        coef_NS = (self.dY * R2) / (12 * self.dZ * L2)
+        coef_B = self.dZ / (2 * self.betha_s)
 
-        self.pad_ct = [ang for ang in range(0, 360, int(360 / self.n_pad))]
+        cond_EW = (self.k_t * self.dZ) / (
+            rho_Cp * self.speed * ((self.betha_s * self.journal_radius) ** 2) * self.dY
+        )
+        cond_NS = (self.k_t * self.dY) / (rho_Cp * self.speed * L2 * self.dZ)
+        conv_EW = self.dZ / (12 * betha_s2)
+        conv_NS = (R2 * self.dY) / (2 * 12 * L2)
 
-        self.thetaI = np.radians(
-            [pad + (180 / self.n_pad) - (self.betha_s_dg / 2) for pad in self.pad_ct]
+        auxb_T = (self.speed * self.reference_viscosity) / (
+            rho_Cp * self.reference_temperature * self.radial_clearance
+        )
+        coef_TG = (self.reference_viscosity * self.speed * R2 * dY_dZ) / (
+            rho_Cp * self.reference_temperature * (self.radial_clearance**2)
         )
+        coef_TH = (self.speed * self.reference_viscosity * 4 * dY_dZ) / (
+            rho_Cp * self.reference_temperature * 3
+        )
+        coef_TI = auxb_T * (R2 * dY_dZ) / self.radial_clearance
+        coef_TJ = auxb_T * (R2 * dY_dZ) / (12 * self.radial_clearance * betha_s2)
+        coef_TK = auxb_T * (R2**2 * dY_dZ) / (12 * self.radial_clearance * L2)
 
-        self.thetaF = np.radians(
-            [pad + (180 / self.n_pad) + (self.betha_s_dg / 2) for pad in self.pad_ct]
+        P_scale = (self.reference_viscosity * self.speed * R2) / (
+            self.radial_clearance**2
         )
 
-        Ytheta = [
-            np.linspace(t1, t2, self.elements_circumferential)
-            for t1, t2 in zip(self.thetaI, self.thetaF)
-        ]
+        # Coefficient matrices, built on the first assembly and refilled in
+        # place afterwards
+
+        Mat_coef = None
+        Mat_coef_T = None
 
         while (T_mist[0] - T_conv) >= 1e-2:
 
-            self.P = np.zeros(
-                (self.elements_axial, self.elements_circumferential, self.n_pad)
+            P = np.zeros(
+                (self.n_pad, self.elements_axial, self.elements_circumferential)
+            )
+            self.Pdim = np.zeros(
+                (self.n_pad, self.elements_axial, self.elements_circumferential)
             )
             dPdy = np.zeros(
-                (self.elements_axial, self.elements_circumferential, self.n_pad)
+                (self.n_pad, self.elements_axial, self.elements_circumferential)
             )
             dPdz = np.zeros(
-                (self.elements_axial, self.elements_circumferential, self.n_pad)
+                (self.n_pad, self.elements_axial, self.elements_circumferential)
             )
             T = np.ones(
-                (self.elements_axial, self.elements_circumferential, self.n_pad)
+                (self.n_pad, self.elements_axial, self.elements_circumferential)
             )
             T_new = (
                 np.ones(
-                    (self.elements_axial, self.elements_circumferential, self.n_pad)
+                    (self.n_pad, self.elements_axial, self.elements_circumferential)
                 )
                 * 1.2
             )
@@ -403,769 +491,284 @@ class THDCylindrical(BearingElement):
             T_conv = T_mist[0]
 
             mu_new = 1.1 * np.ones(
-                (self.elements_axial, self.elements_circumferential, self.n_pad)
+                (self.n_pad, self.elements_axial, self.elements_circumferential)
             )
             mu_turb = 1.3 * np.ones(
-                (self.elements_axial, self.elements_circumferential, self.n_pad)
+                (self.n_pad, self.elements_axial, self.elements_circumferential)
             )
 
-            PP = np.zeros(((self.elements_axial), (2 * self.elements_circumferential)))
+            for n_p in range(self.n_pad):
 
-            nk = (self.elements_axial) * (self.elements_circumferential)
+                T_ref = T_mist[n_p - 1]
 
-            Mat_coef = np.zeros((nk, nk))
-            Mat_coef_T = np.zeros((nk, nk))
-            b = np.zeros((nk, 1))
-            b_T = np.zeros((nk, 1))
+                # Film thickness at the control volume center and faces
 
-            for n_p in np.arange(self.n_pad):
+                cos_c, sin_c, cos_e, sin_e, cos_w, sin_w = self._trig_tables[n_p]
 
-                T_ref = T_mist[n_p - 1]
+                hP = 1 - self.X * cos_c - self.Y * sin_c
+                he = 1 - self.X * cos_e - self.Y * sin_e
+                hw = 1 - self.X * cos_w - self.Y * sin_w
+
+                HP = np.tile(hP, (self.elements_axial, 1))
+                hpt = -self.Ypt * cos_c + self.Xpt * sin_c
+
+                # Cubed film thickness, shared by the pressure and temperature
+                # coefficients
+
+                he3 = he**3
+                hw3 = hw**3
+                hP3 = hP**3
+                hn3 = hP3
+                hs3 = hn3
+
+                # Eddy viscosity scaling factor: laminar below Reyn = 500,
+                # turbulent above Reyn = 1000 and transitional in between
+
+                Reyn[n_p] = (
+                    self.rho
+                    * self.speed
+                    * self.journal_radius
+                    * (HP / self.axial_length)
+                    * self.radial_clearance
+                    / (self.reference_viscosity)
+                )
+
+                self.delta_turb = 1 - np.clip((1000 - Reyn[n_p]) / 500, 0, 1) ** (1 / 8)
+
+                B = coef_B * (he - hw) - (self.Ypt * cos_c + self.Xpt * sin_c) * dy_dZ
+                b = np.tile(B, self.elements_axial)
 
                 # Temperature convergence while
 
                 while (
-                    np.linalg.norm(T_new[:, :, n_p] - T[:, :, n_p])
-                    / np.linalg.norm(T[:, :, n_p])
-                    >= 1e-3
+                    np.linalg.norm(T_new[n_p] - T[n_p]) / np.linalg.norm(T[n_p]) >= 1e-3
                 ):
 
                     T_ref = T_mist[n_p - 1]
 
                     mu = mu_new
-                    self.mu_l = mu_new
-
-                    T[:, :, n_p] = T_new[:, :, n_p]
-
-                    ki = 0
-                    kj = 0
-                    k = 0
-
-                    # Solution of pressure field initialization
-
-                    for ii in np.arange((self.Z_I + 0.5 * self.dZ), self.Z_F, self.dZ):
-                        for jj in np.arange(
-                            self.thetaI[n_p] + (self.dtheta / 2),
-                            self.thetaF[n_p],
-                            self.dtheta,
-                        ):
-
-                            hP = 1 - self.X * np.cos(jj) - self.Y * np.sin(jj)
-                            he = (
-                                1
-                                - self.X * np.cos(jj + 0.5 * self.dtheta)
-                                - self.Y * np.sin(jj + 0.5 * self.dtheta)
-                            )
-                            hw = (
-                                1
-                                - self.X * np.cos(jj - 0.5 * self.dtheta)
-                                - self.Y * np.sin(jj - 0.5 * self.dtheta)
-                            )
-                            hn = hP
-                            hs = hn
-
-                            if kj == 0 and ki == 0:
-                                MU_e = 0.5 * (mu[ki, kj] + mu[ki, kj + 1])
-                                MU_w = mu[ki, kj]
-                                MU_s = mu[ki, kj]
-                                MU_n = 0.5 * (mu[ki, kj] + mu[ki + 1, kj])
-
-                            if kj == 0 and ki > 0 and ki < self.elements_axial - 1:
-                                MU_e = 0.5 * (mu[ki, kj] + mu[ki, kj + 1])
-                                MU_w = mu[ki, kj]
-                                MU_s = 0.5 * (mu[ki, kj] + mu[ki - 1, kj])
-                                MU_n = 0.5 * (mu[ki, kj] + mu[ki + 1, kj])
-
-                            if kj == 0 and ki == self.elements_axial - 1:
-                                MU_e = 0.5 * (mu[ki, kj] + mu[ki, kj + 1])
-                                MU_w = mu[ki, kj]
-                                MU_s = 0.5 * (mu[ki, kj] + mu[ki - 1, kj])
-                                MU_n = mu[ki, kj]
-
-                            if (
-                                ki == 0
-                                and kj > 0
-                                and kj < self.elements_circumferential - 1
-                            ):
-                                MU_e = 0.5 * (mu[ki, kj] + mu[ki, kj + 1])
-                                MU_w = 0.5 * (mu[ki, kj] + mu[ki, kj - 1])
-                                MU_s = mu[ki, kj]
-                                MU_n = 0.5 * (mu[ki, kj] + mu[ki + 1, kj])
-
-                            if (
-                                kj > 0
-                                and kj < self.elements_circumferential - 1
-                                and ki > 0
-                                and ki < self.elements_axial - 1
-                            ):
-                                MU_e = 0.5 * (mu[ki, kj] + mu[ki, kj + 1])
-                                MU_w = 0.5 * (mu[ki, kj] + mu[ki, kj - 1])
-                                MU_s = 0.5 * (mu[ki, kj] + mu[ki - 1, kj])
-                                MU_n = 0.5 * (mu[ki, kj] + mu[ki + 1, kj])
-
-                            if (
-                                ki == self.elements_axial - 1
-                                and kj > 0
-                                and kj < self.elements_circumferential - 1
-                            ):
-                                MU_e = 0.5 * (mu[ki, kj] + mu[ki, kj + 1])
-                                MU_w = 0.5 * (mu[ki, kj] + mu[ki, kj - 1])
-                                MU_s = 0.5 * (mu[ki, kj] + mu[ki - 1, kj])
-                                MU_n = mu[ki, kj]
-
-                            if ki == 0 and kj == self.elements_circumferential - 1:
-                                MU_e = mu[ki, kj]
-                                MU_w = 0.5 * (mu[ki, kj] + mu[ki, kj - 1])
-                                MU_s = mu[ki, kj]
-                                MU_n = 0.5 * (mu[ki, kj] + mu[ki + 1, kj])
-
-                            if (
-                                kj == self.elements_circumferential - 1
-                                and ki > 0
-                                and ki < self.elements_axial - 1
-                            ):
-                                MU_e = mu[ki, kj]
-                                MU_w = 0.5 * (mu[ki, kj] + mu[ki, kj - 1])
-                                MU_s = 0.5 * (mu[ki, kj] + mu[ki - 1, kj])
-                                MU_n = 0.5 * (mu[ki, kj] + mu[ki + 1, kj])
-
-                            if (
-                                kj == self.elements_circumferential - 1
-                                and ki == self.elements_axial - 1
-                            ):
-                                MU_e = mu[ki, kj]
-                                MU_w = 0.5 * (mu[ki, kj] + mu[ki, kj - 1])
-                                MU_s = 0.5 * (mu[ki, kj] + mu[ki - 1, kj])
-                                MU_n = mu[ki, kj]
-
-                            CE = (self.dZ * he**3) / (
-                                12 * MU_e[n_p] * self.dY * self.betha_s**2
-                            )
-                            CW = (self.dZ * hw**3) / (
-                                12 * MU_w[n_p] * self.dY * self.betha_s**2
-                            )
-                            CN = (self.dY * (self.journal_radius**2) * hn**3) / (
-                                12 * MU_n[n_p] * self.dZ * self.axial_length**2
-                            )
-                            CS = (self.dY * (self.journal_radius**2) * hs**3) / (
-                                12 * MU_s[n_p] * self.dZ * self.axial_length**2
-                            )
-                            CP = -(CE + CW + CN + CS)
-
-                            B = (self.dZ / (2 * self.betha_s)) * (he - hw) - (
-                                (self.Ypt * np.cos(jj) + self.Xpt * np.sin(jj))
-                                * self.dy
-                                * self.dZ
-                            )
-
-                            k = k + 1
-                            b[k - 1, 0] = B
-
-                            if ki == 0 and kj == 0:
-                                Mat_coef[k - 1, k - 1] = CP - CS - CW
-                                Mat_coef[k - 1, k] = CE
-                                Mat_coef[
-                                    k - 1, k + self.elements_circumferential - 1
-                                ] = CN
-
-                            elif kj == 0 and ki > 0 and ki < self.elements_axial - 1:
-                                Mat_coef[k - 1, k - 1] = CP - CW
-                                Mat_coef[k - 1, k] = CE
-                                Mat_coef[
-                                    k - 1, k - self.elements_circumferential - 1
-                                ] = CS
-                                Mat_coef[
-                                    k - 1, k + self.elements_circumferential - 1
-                                ] = CN
-
-                            elif kj == 0 and ki == self.elements_axial - 1:
-                                Mat_coef[k - 1, k - 1] = CP - CN - CW
-                                Mat_coef[k - 1, k] = CE
-                                Mat_coef[
-                                    k - 1, k - self.elements_circumferential - 1
-                                ] = CS
-
-                            elif ki == 0 and kj > 0 and kj < self.n_y - 1:
-                                Mat_coef[k - 1, k - 1] = CP - CS
-                                Mat_coef[k - 1, k] = CE
-                                Mat_coef[k - 1, k - 2] = CW
-                                Mat_coef[
-                                    k - 1, k + self.elements_circumferential - 1
-                                ] = CN
-
-                            elif (
-                                ki > 0
-                                and ki < self.elements_axial - 1
-                                and kj > 0
-                                and kj < self.n_y - 1
-                            ):
-                                Mat_coef[k - 1, k - 1] = CP
-                                Mat_coef[k - 1, k - 2] = CW
-                                Mat_coef[
-                                    k - 1, k - self.elements_circumferential - 1
-                                ] = CS
-                                Mat_coef[
-                                    k - 1, k + self.elements_circumferential - 1
-                                ] = CN
-                                Mat_coef[k - 1, k] = CE
-
-                            elif (
-                                ki == self.elements_axial - 1
-                                and kj > 0
-                                and kj < self.n_y - 1
-                            ):
-                                Mat_coef[k - 1, k - 1] = CP - CN
-                                Mat_coef[k - 1, k] = CE
-                                Mat_coef[k - 1, k - 2] = CW
-                                Mat_coef[
-                                    k - 1, k - self.elements_circumferential - 1
-                                ] = CS
-
-                            elif ki == 0 and kj == self.n_y - 1:
-                                Mat_coef[k - 1, k - 1] = CP - CE - CS
-                                Mat_coef[k - 1, k - 2] = CW
-                                Mat_coef[
-                                    k - 1, k + self.elements_circumferential - 1
-                                ] = CN
-
-                            elif (
-                                kj == self.n_y - 1
-                                and ki > 0
-                                and ki < self.elements_axial - 1
-                            ):
-                                Mat_coef[k - 1, k - 1] = CP - CE
-                                Mat_coef[k - 1, k - 2] = CW
-                                Mat_coef[
-                                    k - 1, k - self.elements_circumferential - 1
-                                ] = CS
-                                Mat_coef[
-                                    k - 1, k + self.elements_circumferential - 1
-                                ] = CN
-
-                            elif ki == self.elements_axial - 1 and kj == self.n_y - 1:
-                                Mat_coef[k - 1, k - 1] = CP - CE - CN
-                                Mat_coef[k - 1, k - 2] = CW
-                                Mat_coef[
-                                    k - 1, k - self.elements_circumferential - 1
-                                ] = CS
-
-                            kj = kj + 1
-
-                        kj = 0
-                        ki = ki + 1
 
-                    # Solution of pressure field end
+                    T[n_p] = T_new[n_p]
+
+                    # Viscosity at the control volume faces
 
-                    p = np.linalg.solve(Mat_coef, b)
-                    cont = 0
+                    mu_pad = mu[n_p]
 
-                    for i in np.arange(self.elements_axial):
-                        for j in np.arange(self.elements_circumferential):
+                    MU_e = np.copy(mu_pad)
+                    MU_w = np.copy(mu_pad)
+                    MU_n = np.copy(mu_pad)
+                    MU_s = np.copy(mu_pad)
 
-                            self.P[i, j, n_p] = p[cont]
-                            cont = cont + 1
+                    MU_e[:, :-1] = 0.5 * (mu_pad[:, :-1] + mu_pad[:, 1:])
+                    MU_w[:, 1:] = 0.5 * (mu_pad[:, 1:] + mu_pad[:, :-1])
+                    MU_n[:-1, :] = 0.5 * (mu_pad[:-1, :] + mu_pad[1:, :])
+                    MU_s[1:, :] = 0.5 * (mu_pad[1:, :] + mu_pad[:-1, :])
 
-                            if self.P[i, j, n_p] < 0:
-                                self.P[i, j, n_p] = 0
+                    CE = coef_EW * he3 / MU_e
+                    CW = coef_EW * hw3 / MU_w
+                    CN = coef_NS * hn3 / MU_n
+                    CS = coef_NS * hs3 / MU_s
+                    CP = -(CE + CW + CN + CS)
+
+                    # Boundary conditions: null pressure at the pad edges
+
+                    CP[:, 0] = CP[:, 0] - CW[:, 0]
+                    CP[:, -1] = CP[:, -1] - CE[:, -1]
+                    CP[0, :] = CP[0, :] - CS[0, :]
+                    CP[-1, :] = CP[-1, :] - CN[-1, :]
+
+                    Mat_coef = _stencil_matrix(
+                        CP, CE, CW, CN, CS, self._pattern, Mat_coef
+                    )
+
+                    # Solution of pressure field end
+
+                    p = spsolve(Mat_coef, b)
+
+                    # Cavitation: negative pressures are set to zero
+
+                    P[n_p] = np.maximum(
+                        p.reshape(self.elements_axial, self.elements_circumferential),
+                        0,
+                    )
 
                     # Dimensional pressure fied
 
-                    self.Pdim = (
-                        self.P
-                        * self.reference_viscosity
-                        * self.speed
-                        * (self.journal_radius**2)
-                    ) / (self.radial_clearance**2)
-
-                    ki = 0
-                    kj = 0
-                    k = 0
-
-                    # Solution of temperature field initialization
-
-                    for ii in np.arange(
-                        (self.Z_I + 0.5 * self.dZ), (self.Z_F), self.dZ
-                    ):
-                        for jj in np.arange(
-                            self.thetaI[n_p] + (self.dtheta / 2),
-                            self.thetaF[n_p],
-                            self.dtheta,
-                        ):
-
-                            # Pressure gradients
-
-                            if kj == 0 and ki == 0:
-                                dPdy[ki, kj, n_p] = (self.P[ki, kj + 1, n_p] - 0) / (
-                                    2 * self.dY
-                                )
-                                dPdz[ki, kj, n_p] = (self.P[ki + 1, kj, n_p] - 0) / (
-                                    2 * self.dZ
-                                )
-
-                            if kj == 0 and ki > 0 and ki < self.elements_axial - 1:
-                                dPdy[ki, kj, n_p] = (self.P[ki, kj + 1, n_p] - 0) / (
-                                    2 * self.dY
-                                )
-                                dPdz[ki, kj, n_p] = (
-                                    self.P[ki + 1, kj, n_p] - self.P[ki - 1, kj, n_p]
-                                ) / (2 * self.dZ)
-
-                            if kj == 0 and ki == self.elements_axial - 1:
-                                dPdy[ki, kj, n_p] = (self.P[ki, kj + 1, n_p] - 0) / (
-                                    2 * self.dY
-                                )
-                                dPdz[ki, kj, n_p] = (0 - self.P[ki - 1, kj, n_p]) / (
-                                    2 * self.dZ
-                                )
-
-                            if (
-                                ki == 0
-                                and kj > 0
-                                and kj < self.elements_circumferential - 1
-                            ):
-                                dPdy[ki, kj, n_p] = (
-                                    self.P[ki, kj + 1, n_p] - self.P[ki, kj - 1, n_p]
-                                ) / (2 * self.dY)
-                                dPdz[ki, kj, n_p] = (self.P[ki + 1, kj, n_p] - 0) / (
-                                    2 * self.dZ
-                                )
-
-                            if (
-                                kj > 0
-                                and kj < self.elements_circumferential - 1
-                                and ki > 0
-                                and ki < self.elements_axial - 1
-                            ):
-                                dPdy[ki, kj, n_p] = (
-                                    self.P[ki, kj + 1, n_p] - self.P[ki, kj - 1, n_p]
-                                ) / (2 * self.dY)
-                                dPdz[ki, kj, n_p] = (
-                                    self.P[ki + 1, kj, n_p] - self.P[ki - 1, kj, n_p]
-                                ) / (2 * self.dZ)
-
-                            if (
-                                ki == self.elements_axial - 1
-                                and kj > 0
-                                and kj < self.elements_circumferential - 1
-                            ):
-                                dPdy[ki, kj, n_p] = (
-                                    self.P[ki, kj + 1, n_p] - self.P[ki, kj - 1, n_p]
-                                ) / (2 * self.dY)
-                                dPdz[ki, kj, n_p] = (0 - self.P[ki - 1, kj, n_p]) / (
-                                    2 * self.dZ
-                                )
-
-                            if ki == 0 and kj == self.elements_circumferential - 1:
-                                dPdy[ki, kj, n_p] = (0 - self.P[ki, kj - 1, n_p]) / (
-                                    2 * self.dY
-                                )
-                                dPdz[ki, kj, n_p] = (self.P[ki + 1, kj, n_p] - 0) / (
-                                    2 * self.dZ
-                                )
-
-                            if (
-                                kj == self.elements_circumferential - 1
-                                and ki > 0
-                                and ki < self.elements_axial - 1
-                            ):
-                                dPdy[ki, kj, n_p] = (0 - self.P[ki, kj - 1, n_p]) / (
-                                    2 * self.dY
-                                )
-                                dPdz[ki, kj, n_p] = (
-                                    self.P[ki + 1, kj, n_p] - self.P[ki - 1, kj, n_p]
-                                ) / (2 * self.dZ)
-
-                            if (
-                                kj == self.elements_circumferential - 1
-                                and ki == self.elements_axial - 1
-                            ):
-                                dPdy[ki, kj, n_p] = (0 - self.P[ki, kj - 1, n_p]) / (
-                                    2 * self.dY
-                                )
-                                dPdz[ki, kj, n_p] = (0 - self.P[ki - 1, kj, n_p]) / (
-                                    2 * self.dZ
-                                )
-
-                            HP = 1 - self.X * np.cos(jj) - self.Y * np.sin(jj)
-                            hpt = -self.Ypt * np.cos(jj) + self.Xpt * np.sin(jj)
-
-                            mu_p = mu[ki, kj, n_p]
-
-                            Reyn[ki, kj, n_p] = (
-                                self.rho
-                                * self.speed
-                                * self.journal_radius
-                                * (HP / self.axial_length)
-                                * self.radial_clearance
-                                / (self.reference_viscosity)
-                            )
-
-                            if Reyn[ki, kj, n_p] <= 500:
-
-                                self.delta_turb = 0
-
-                            elif Reyn[ki, kj, n_p] > 400 and Reyn[ki, kj, n_p] <= 1000:
-
-                                self.delta_turb = 1 - (
-                                    (1000 - Reyn[ki, kj, n_p]) / 500
-                                ) ** (1 / 8)
-
-                            elif Reyn[ki, kj, n_p] > 1000:
-
-                                self.delta_turb = 1
-
-                            dudy = ((HP / mu_turb[ki, kj, n_p]) * dPdy[ki, kj, n_p]) - (
-                                self.speed / HP
-                            )
-
-                            dwdy = (HP / mu_turb[ki, kj, n_p]) * dPdz[ki, kj, n_p]
-
-                            tal = mu_turb[ki, kj, n_p] * np.sqrt(
-                                (dudy**2) + (dwdy**2)
-                            )
-
-                            x_wall = (
-                                (HP * self.radial_clearance * 2)
-                                / (
-                                    self.reference_viscosity
-                                    * mu_turb[ki, kj, n_p]
-                                    / self.rho
-                                )
-                            ) * ((abs(tal) / self.rho) ** 0.5)
-
-                            emv = 0.4 * (x_wall - (10.7 * np.tanh(x_wall / 10.7)))
-
-                            mu_turb[ki, kj, n_p] = mu_p * (1 + (self.delta_turb * emv))
-
-                            mi_t = mu_turb[ki, kj, n_p]
-
-                            AE = -(self.k_t * HP * self.dZ) / (
-                                self.rho
-                                * self.Cp
-                                * self.speed
-                                * ((self.betha_s * self.journal_radius) ** 2)
-                                * self.dY
-                            )
-                            AW = (
-                                (
-                                    ((HP**3) * dPdy[ki, kj, n_p] * self.dZ)
-                                    / (12 * mi_t * (self.betha_s**2))
-                                )
-                                - ((HP) * self.dZ / (2 * self.betha_s))
-                                - (
-                                    (self.k_t * HP * self.dZ)
-                                    / (
-                                        self.rho
-                                        * self.Cp
-                                        * self.speed
-                                        * ((self.betha_s * self.journal_radius) ** 2)
-                                        * self.dY
-                                    )
-                                )
-                            )
-
-                            AN = -(
-                                (
-                                    (self.journal_radius**2)
-                                    * (HP**3)
-                                    * (dPdz[ki, kj, n_p] * self.dY)
-                                )
-                                / (2 * 12 * (self.axial_length**2) * mi_t)
-                            ) - (
-                                (self.k_t * HP * self.dY)
-                                / (
-                                    self.rho
-                                    * self.Cp
-                                    * self.speed
-                                    * (self.axial_length**2)
-                                    * self.dZ
-                                )
-                            )
-
-                            AS = (
-                                (
-                                    (self.journal_radius**2)
-                                    * (HP**3)
-                                    * (dPdz[ki, kj, n_p] * self.dY)
-                                )
-                                / (2 * 12 * (self.axial_length**2) * mi_t)
-                            ) - (
-                                (self.k_t * HP * self.dY)
-                                / (
-                                    self.rho
-                                    * self.Cp
-                                    * self.speed
-                                    * (self.axial_length**2)
-                                    * self.dZ
-                                )
-                            )
-
-                            AP = -(AE + AW + AN + AS)
-
-                            auxb_T = (self.speed * self.reference_viscosity) / (
-                                self.rho
-                                * self.Cp
-                                * self.reference_temperature
-                                * self.radial_clearance
-                            )
-                            b_TG = (
-                                self.reference_viscosity
-                                * self.speed
-                                * (self.journal_radius**2)
-                                * self.dY
-                                * self.dZ
-                                * self.P[ki, kj, n_p]
-                                * hpt
-                            ) / (
-                                self.rho
-                                * self.Cp
-                                * self.reference_temperature
-                                * (self.radial_clearance**2)
-                            )
-                            b_TH = (
-                                self.speed
-                                * self.reference_viscosity
-                                * (hpt**2)
-                                * 4
-                                * mi_t
-                                * self.dY
-                                * self.dZ
-                            ) / (
-                                self.rho * self.Cp * self.reference_temperature * 3 * HP
-                            )
-                            b_TI = (
-                                auxb_T
-                                * (
-                                    mi_t
-                                    * (self.journal_radius**2)
-                                    * self.dY
-                                    * self.dZ
-                                )
-                                / (HP * self.radial_clearance)
-                            )
-                            b_TJ = (
-                                auxb_T
-                                * (
-                                    (self.journal_radius**2)
-                                    * (HP**3)
-                                    * (dPdy[ki, kj, n_p] ** 2)
-                                    * self.dY
-                                    * self.dZ
-                                )
-                                / (
-                                    12
-                                    * self.radial_clearance
-                                    * (self.betha_s**2)
-                                    * mi_t
-                                )
-                            )
-                            b_TK = (
-                                auxb_T
-                                * (
-                                    (self.journal_radius**4)
-                                    * (HP**3)
-                                    * (dPdz[ki, kj, n_p] ** 2)
-                                    * self.dY
-                                    * self.dZ
-                                )
-                                / (
-                                    12
-                                    * self.radial_clearance
-                                    * (self.axial_length**2)
-                                    * mi_t
-                                )
-                            )
-
-                            B_T = b_TG + b_TH + b_TI + b_TJ + b_TK
-
-                            k = k + 1
-
-                            b_T[k - 1, 0] = B_T
-
-                            if ki == 0 and kj == 0:
-                                Mat_coef_T[k - 1, k - 1] = AP + AS - AW
-                                Mat_coef_T[k - 1, k] = AE
-                                Mat_coef_T[
-                                    k - 1, k + self.elements_circumferential - 1
-                                ] = AN
-                                b_T[k - 1, 0] = b_T[k - 1, 0] - 2 * AW * (
-                                    T_ref / self.reference_temperature
-                                )
-
-                            elif kj == 0 and ki > 0 and ki < self.elements_axial - 1:
-                                Mat_coef_T[k - 1, k - 1] = AP - AW
-                                Mat_coef_T[k - 1, k] = AE
-                                Mat_coef_T[
-                                    k - 1, k - self.elements_circumferential - 1
-                                ] = AS
-                                Mat_coef_T[
-                                    k - 1, k + self.elements_circumferential - 1
-                                ] = AN
-                                b_T[k - 1, 0] = b_T[k - 1, 0] - 2 * AW * (
-                                    T_ref / self.reference_temperature
-                                )
-
-                            elif kj == 0 and ki == self.elements_axial - 1:
-                                Mat_coef_T[k - 1, k - 1] = AP + AN - AW
-                                Mat_coef_T[k - 1, k] = AE
-                                Mat_coef_T[
-                                    k - 1, k - self.elements_circumferential - 1
-                                ] = AS
-                                b_T[k - 1, 0] = b_T[k - 1, 0] - 2 * AW * (
-                                    T_ref / self.reference_temperature
-                                )
-
-                            elif ki == 0 and kj > 0 and kj < self.n_y - 1:
-                                Mat_coef_T[k - 1, k - 1] = AP + AS
-                                Mat_coef_T[k - 1, k] = AE
-                                Mat_coef_T[k - 1, k - 2] = AW
-                                Mat_coef_T[
-                                    k - 1, k + self.elements_circumferential - 1
-                                ] = AN
-
-                            elif (
-                                ki > 0
-                                and ki < self.elements_axial - 1
-                                and kj > 0
-                                and kj < self.n_y - 1
-                            ):
-                                Mat_coef_T[k - 1, k - 1] = AP
-                                Mat_coef_T[k - 1, k - 2] = AW
-                                Mat_coef_T[
-                                    k - 1, k - self.elements_circumferential - 1
-                                ] = AS
-                                Mat_coef_T[
-                                    k - 1, k + self.elements_circumferential - 1
-                                ] = AN
-                                Mat_coef_T[k - 1, k] = AE
-
-                            elif (
-                                ki == self.elements_axial - 1
-                                and kj > 0
-                                and kj < self.n_y - 1
-                            ):
-                                Mat_coef_T[k - 1, k - 1] = AP + AN
-                                Mat_coef_T[k - 1, k] = AE
-                                Mat_coef_T[k - 1, k - 2] = AW
-                                Mat_coef_T[
-                                    k - 1, k - self.elements_circumferential - 1
-                                ] = AS
-
-                            elif ki == 0 and kj == self.n_y - 1:
-                                Mat_coef_T[k - 1, k - 1] = AP + AE + AS
-                                Mat_coef_T[k - 1, k - 2] = AW
-                                Mat_coef_T[
-                                    k - 1, k + self.elements_circumferential - 1
-                                ] = AN
-
-                            elif (
-                                kj == self.n_y - 1
-                                and ki > 0
-                                and ki < self.elements_axial - 1
-                            ):
-                                Mat_coef_T[k - 1, k - 1] = AP + AE
-                                Mat_coef_T[k - 1, k - 2] = AW
-                                Mat_coef_T[
-                                    k - 1, k - self.elements_circumferential - 1
-                                ] = AS
-                                Mat_coef_T[
-                                    k - 1, k + self.elements_circumferential - 1
-                                ] = AN
-
-                            elif ki == self.elements_axial - 1 and kj == self.n_y - 1:
-                                Mat_coef_T[k - 1, k - 1] = AP + AE + AN
-                                Mat_coef_T[k - 1, k - 2] = AW
-                                Mat_coef_T[
-                                    k - 1, k - self.elements_circumferential - 1
-                                ] = AS
-
-                            kj = kj + 1
-
-                        kj = 0
-                        ki = ki + 1
+                    self.Pdim[n_p] = P[n_p] * P_scale
 
-                    # Solution of temperature field end
+                    # Pressure gradients, with zero pressure outside the pad
 
-                    t = np.linalg.solve(Mat_coef_T, b_T)
-                    cont = 0
+                    P_pad = np.pad(P[n_p], 1)
+                    dPdy_p = (P_pad[1:-1, 2:] - P_pad[1:-1, :-2]) / (2 * self.dY)
+                    dPdz_p = (P_pad[2:, 1:-1] - P_pad[:-2, 1:-1]) / (2 * self.dZ)
+                    dPdy[n_p] = dPdy_p
+                    dPdz[n_p] = dPdz_p
 
-                    for i in np.arange(self.elements_axial):
-                        for j in np.arange(self.elements_circumferential):
+                    # Eddy viscosity from the wall function
 
-                            T_new[i, j, n_p] = t[cont]
-                            cont = cont + 1
+                    mu_t = mu_turb[n_p]
 
-                    Tdim = T_new * self.reference_temperature
+                    dudy = ((HP / mu_t) * dPdy_p) - (self.speed / HP)
+                    dwdy = (HP / mu_t) * dPdz_p
+                    tal = mu_t * np.sqrt((dudy**2) + (dwdy**2))
 
-                    T_end = np.sum(Tdim[:, -1, n_p]) / self.elements_axial
+                    x_wall = (
+                        (HP * self.radial_clearance * 2)
+                        / (self.reference_viscosity * mu_t / self.rho)
+                    ) * ((np.abs(tal) / self.rho) ** 0.5)
 
-                    T_mist[n_p] = (
-                        self.fat_mixt[n_p] * self.reference_temperature
-                        + (1 - self.fat_mixt[n_p]) * T_end
-                    )
+                    emv = 0.4 * (x_wall - (10.7 * np.tanh(x_wall / 10.7)))
 
-                    for i in np.arange(self.elements_axial):
-                        for j in np.arange(self.elements_circumferential):
+                    mu_turb[n_p] = mu[n_p] * (1 + (self.delta_turb * emv))
 
-                            mu_new[i, j, n_p] = (
-                                self.a * (Tdim[i, j, n_p]) ** self.b
-                            ) / self.reference_viscosity
+                    # Temperature field coefficients
 
-        PP = np.zeros(
-            ((self.elements_axial), (self.n_pad * self.elements_circumferential))
-        )
+                    mi_t = mu_turb[n_p]
+                    HP3_mi_t = hP3 / mi_t
 
-        i = 0
-        for i in range(self.elements_axial):
+                    AE = -cond_EW * HP
+                    AW = conv_EW * HP3_mi_t * dPdy_p - coef_B * HP - cond_EW * HP
+                    AN = -conv_NS * HP3_mi_t * dPdz_p - cond_NS * HP
+                    AS = conv_NS * HP3_mi_t * dPdz_p - cond_NS * HP
+                    AP = -(AE + AW + AN + AS)
 
-            PP[i] = self.Pdim[i, :, :].ravel("F")
+                    b_TG = coef_TG * P[n_p] * hpt
+                    b_TH = coef_TH * (hpt**2) * mi_t / HP
+                    b_TI = coef_TI * mi_t / HP
+                    b_TJ = coef_TJ * HP3_mi_t * (dPdy_p**2)
+                    b_TK = coef_TK * HP3_mi_t * (dPdz_p**2)
 
-        Ytheta = np.array(Ytheta)
-        Ytheta = Ytheta.flatten()
+                    B_T = b_TG + b_TH + b_TI + b_TJ + b_TK
 
-        auxF = np.zeros((2, len(Ytheta)))
+                    # Boundary conditions: oil inlet temperature at the leading
+                    # edge and adiabatic remaining edges
 
-        auxF[0, :] = np.cos(Ytheta)
-        auxF[1, :] = np.sin(Ytheta)
+                    AP[:, 0] = AP[:, 0] - AW[:, 0]
+                    AP[:, -1] = AP[:, -1] + AE[:, -1]
+                    AP[0, :] = AP[0, :] + AS[0, :]
+                    AP[-1, :] = AP[-1, :] + AN[-1, :]
+                    B_T[:, 0] = B_T[:, 0] - 2 * AW[:, 0] * (
+                        T_ref / self.reference_temperature
+                    )
 
-        dA = self.dy * self.dz
+                    Mat_coef_T = _stencil_matrix(
+                        AP, AE, AW, AN, AS, self._pattern, Mat_coef_T
+                    )
+                    b_T = B_T.ravel()
 
-        auxP = PP * dA
+                    # Solution of temperature field end
 
-        vector_auxF_x = auxF[0, :]
-        vector_auxF_y = auxF[1, :]
+                    t = spsolve(Mat_coef_T, b_T)
 
-        auxFx = auxP * vector_auxF_x
-        auxFy = auxP * vector_auxF_y
+                    T_new[n_p] = t.reshape(
+                        self.elements_axial, self.elements_circumferential
+                    )
+
+                    Tdim = T_new[n_p] * self.reference_temperature
 
-        fxj = -np.sum(auxFx)
-        fyj = -np.sum(auxFy)
+                    T_end = np.sum(Tdim[:, -1]) / self.elements_axial
 
-        Fhx = fxj
-        Fhy = fyj
+                    T_mist[n_p] = (
+                        self.fat_mixt[n_p] * self.reference_temperature
+                        + (1 - self.fat_mixt[n_p]) * T_end
+                    )
+
+                    mu_new[n_p] = (self.a * Tdim**self.b) / self.reference_viscosity
+
+        self.P = P
+        self.mu_l = mu_new
+
+        # Integration of the pressure field over the pads
+
+        dA = self.dy * self.dz
+
+        Fhx = -dA * np.einsum("pij,pj->", self.Pdim, self._cos_Ytheta)
+        Fhy = -dA * np.einsum("pij,pj->", self.Pdim, self._sin_Ytheta)
         self.Fhx = Fhx
         self.Fhy = Fhy
         return Fhx, Fhy
 
-    def run(self):
+    def run(self, method=None):
         """This method runs the optimization to find the equilibrium position of
         the rotor's center.
 
+        The equilibrium position is given by the eccentricity ratio and the
+        attitude angle. By default, the force imbalance is solved as a
+        nonlinear least squares problem, whose finite difference Jacobian
+        needs far fewer evaluations of the oil film forces than a scalar
+        minimization of the imbalance magnitude. The eccentricity ratio is
+        bounded to 0.95 to keep the film thickness positive. Close to this bound
+        the film is so thin that the pressure and temperature systems may become
+        singular, so a heavily loaded bearing may stop at the bound without
+        balancing the load. A warning is issued whenever the remaining force
+        imbalance is larger than 0.1% of the applied load.
 
+        Parameters
+        ----------
+        method : str, optional
+            Optimization method. "trf" and "dogbox" are solved by
+            scipy.optimize.least_squares. The bounded methods of
+            scipy.optimize.minimize ("Nelder-Mead", "L-BFGS-B", "TNC", "SLSQP",
+            "Powell" and "trust-constr") minimize the magnitude of the force
+            imbalance instead, with a tolerance of 10e-3 newton.
+            Default is the equilibrium_method of the bearing.
         """
+        if method is None:
+            method = self.equilibrium_method
+
+        least_squares_methods = ("trf", "dogbox")
+        minimize_methods = (
+            "nelder-mead",
+            "l-bfgs-b",
+            "tnc",
+            "slsqp",
+            "powell",
+            "trust-constr",
+        )
+        is_minimize = method.lower() in minimize_methods
+        if method not in least_squares_methods and not is_minimize:
+            raise ValueError(
+                f"{method} can not be used to find the equilibrium position. "
+                'Use "trf", "dogbox" or one of the bounded methods of '
+                f"scipy.optimize.minimize: {', '.join(minimize_methods)}."
+            )
+
         args = self.print_progress
         t1 = time.time()
-        res = minimize(
-            self._score,
-            self.initial_guess,
-            args,
-            method="Nelder-Mead",
-            tol=10e-3,
-            options={"maxiter": 1000},
-        )
+        if method in least_squares_methods:
+            res = least_squares(
+                self._residual,
+                self.initial_guess,
+                method=method,
+                bounds=([0, -np.inf], [0.95, np.inf]),
+                args=(args,),
+            )
+        else:
+            res = minimize(
+                self._score,
+                self.initial_guess,
+                args,
+                method=method,
+                bounds=[(0, 0.95), (None, None)],
+                tol=10e-3,
+                options={"maxfun" if method.lower() == "tnc" else "maxiter": 1000},
+            )
         self.equilibrium_pos = res.x
         t2 = time.time()
 
+        if method in least_squares_methods:
+            imbalance = np.linalg.norm(res.fun)
+        else:
+            imbalance = res.fun / math.hypot(
+                self.load_x_direction, self.load_y_direction
+            )
+
+        if not res.success or imbalance > 1e-3:
+            warnings.warn(
+                "The equilibrium position did not converge. The force imbalance "
+                f"is {imbalance:.2%} of the applied load."
+            )
+
         if self.print_result:
             print(res)
 
@@ -1257,95 +860,123 @@ class THDCylindrical(BearingElement):
         xeq = (
             self.equilibrium_pos[0]
             * self.radial_clearance
-            * np.cos(self.equilibrium_pos[1])
+            * math.cos(self.equilibrium_pos[1])
         )
         yeq = (
             self.equilibrium_pos[0]
             * self.radial_clearance
-            * np.sin(self.equilibrium_pos[1])
+            * math.sin(self.equilibrium_pos[1])
         )
 
         dE = 0.001
-        epix = np.abs(dE * self.radial_clearance * np.cos(self.equilibrium_pos[1]))
-        epiy = np.abs(dE * self.radial_clearance * np.sin(self.equilibrium_pos[1]))
+        epix = abs(dE * self.radial_clearance * math.cos(self.equilibrium_pos[1]))
+        epiy = abs(dE * self.radial_clearance * math.sin(self.equilibrium_pos[1]))
 
         Va = self.speed * (self.journal_radius)
-        epixpt = 0.000001 * np.abs(Va * np.sin(self.equilibrium_pos[1]))
-        epiypt = 0.000001 * np.abs(Va * np.cos(self.equilibrium_pos[1]))
+        epixpt = 0.000001 * abs(Va * math.sin(self.equilibrium_pos[1]))
+        epiypt = 0.000001 * abs(Va * math.cos(self.equilibrium_pos[1]))
+
+        perturbations = [
+            (xeq + epix, yeq, 0, 0),
+            (xeq - epix, yeq, 0, 0),
+            (xeq, yeq + epiy, 0, 0),
+            (xeq, yeq - epiy, 0, 0),
+            (xeq, yeq, epixpt, 0),
+            (xeq, yeq, -epixpt, 0),
+            (xeq, yeq, 0, epiypt),
+            (xeq, yeq, 0, -epiypt),
+        ]
 
-        Auinitial_guess1 = self._forces(xeq + epix, yeq, 0, 0)
-        Auinitial_guess2 = self._forces(xeq - epix, yeq, 0, 0)
-        Auinitial_guess3 = self._forces(xeq, yeq + epiy, 0, 0)
-        Auinitial_guess4 = self._forces(xeq, yeq - epiy, 0, 0)
+        # The fields left by the equilibrium search are restored afterwards, so
+        # that the state of the bearing does not depend on whether the
+        # perturbations are solved here or in worker processes
+        state = {
+            attr: getattr(self, attr)
+            for attr in (
+                "X",
+                "Y",
+                "Xpt",
+                "Ypt",
+                "P",
+                "Pdim",
+                "mu_l",
+                "delta_turb",
+                "Fhx",
+                "Fhy",
+            )
+        }
 
-        Auinitial_guess5 = self._forces(xeq, yeq, epixpt, 0)
-        Auinitial_guess6 = self._forces(xeq, yeq, -epixpt, 0)
-        Auinitial_guess7 = self._forces(xeq, yeq, 0, epiypt)
-        Auinitial_guess8 = self._forces(xeq, yeq, 0, -epiypt)
+        # The perturbed force fields are independent of each other
+        if self.workers > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                forces = list(executor.map(self._forces, *zip(*perturbations)))
+        else:
+            forces = [self._forces(*perturbation) for perturbation in perturbations]
 
-        Kxx = -self.sommerfeld(Auinitial_guess1[0], Auinitial_guess2[1]) * (
-            (Auinitial_guess1[0] - Auinitial_guess2[0]) / (epix / self.radial_clearance)
-        )
-        Kxy = -self.sommerfeld(Auinitial_guess3[0], Auinitial_guess4[1]) * (
-            (Auinitial_guess3[0] - Auinitial_guess4[0]) / (epiy / self.radial_clearance)
-        )
-        Kyx = -self.sommerfeld(Auinitial_guess1[1], Auinitial_guess2[1]) * (
-            (Auinitial_guess1[1] - Auinitial_guess2[1]) / (epix / self.radial_clearance)
-        )
-        Kyy = -self.sommerfeld(Auinitial_guess3[1], Auinitial_guess4[1]) * (
-            (Auinitial_guess3[1] - Auinitial_guess4[1]) / (epiy / self.radial_clearance)
-        )
+        for attr, value in state.items():
+            setattr(self, attr, value)
 
-        Cxx = -self.sommerfeld(Auinitial_guess5[0], Auinitial_guess6[0]) * (
-            (Auinitial_guess6[0] - Auinitial_guess5[0])
-            / (epixpt / self.radial_clearance / self.speed)
-        )
-        Cxy = -self.sommerfeld(Auinitial_guess7[0], Auinitial_guess8[0]) * (
-            (Auinitial_guess8[0] - Auinitial_guess7[0])
-            / (epiypt / self.radial_clearance / self.speed)
-        )
-        Cyx = -self.sommerfeld(Auinitial_guess5[1], Auinitial_guess6[1]) * (
-            (Auinitial_guess6[1] - Auinitial_guess5[1])
-            / (epixpt / self.radial_clearance / self.speed)
-        )
-        Cyy = -self.sommerfeld(Auinitial_guess7[1], Auinitial_guess8[1]) * (
-            (Auinitial_guess8[1] - Auinitial_guess7[1])
-            / (epiypt / self.radial_clearance / self.speed)
-        )
+        (
+            Auinitial_guess1,
+            Auinitial_guess2,
+            Auinitial_guess3,
+            Auinitial_guess4,
+            Auinitial_guess5,
+            Auinitial_guess6,
+            Auinitial_guess7,
+            Auinitial_guess8,
+        ) = forces
 
-        kxx = (
-            np.sqrt((self.load_x_direction**2) + (self.load_y_direction**2))
-            / self.radial_clearance
-        ) * Kxx
-        kxy = (
-            np.sqrt((self.load_x_direction**2) + (self.load_y_direction**2))
-            / self.radial_clearance
-        ) * Kxy
-        kyx = (
-            np.sqrt((self.load_x_direction**2) + (self.load_y_direction**2))
-            / self.radial_clearance
-        ) * Kyx
-        kyy = (
-            np.sqrt((self.load_x_direction**2) + (self.load_y_direction**2))
-            / self.radial_clearance
-        ) * Kyy
-
-        cxx = (
-            np.sqrt((self.load_x_direction**2) + (self.load_y_direction**2))
-            / (self.radial_clearance * self.speed)
-        ) * Cxx
-        cxy = (
-            np.sqrt((self.load_x_direction**2) + (self.load_y_direction**2))
-            / (self.radial_clearance * self.speed)
-        ) * Cxy
-        cyx = (
-            np.sqrt((self.load_x_direction**2) + (self.load_y_direction**2))
-            / (self.radial_clearance * self.speed)
-        ) * Cyx
-        cyy = (
-            np.sqrt((self.load_x_direction**2) + (self.load_y_direction**2))
-            / (self.radial_clearance * self.speed)
-        ) * Cyy
+        # Dimensionless perturbations and dimensional scale of the coefficients
+
+        epix_adm = epix / self.radial_clearance
+        epiy_adm = epiy / self.radial_clearance
+        epixpt_adm = epixpt / self.radial_clearance / self.speed
+        epiypt_adm = epiypt / self.radial_clearance / self.speed
+
+        W = math.hypot(self.load_x_direction, self.load_y_direction)
+        k_scale = W / self.radial_clearance
+        c_scale = W / (self.radial_clearance * self.speed)
+
+        # Sommerfeld number of each coefficient. The first type does not
+        # depend on the perturbed forces, so it is computed only once.
+
+        if self.sommerfeld_type == 1:
+            S = [self.sommerfeld(0, 0)] * 8
+        else:
+            sommerfeld_forces = [
+                (Auinitial_guess1[0], Auinitial_guess2[1]),
+                (Auinitial_guess3[0], Auinitial_guess4[1]),
+                (Auinitial_guess1[1], Auinitial_guess2[1]),
+                (Auinitial_guess3[1], Auinitial_guess4[1]),
+                (Auinitial_guess5[0], Auinitial_guess6[0]),
+                (Auinitial_guess7[0], Auinitial_guess8[0]),
+                (Auinitial_guess5[1], Auinitial_guess6[1]),
+                (Auinitial_guess7[1], Auinitial_guess8[1]),
+            ]
+            S = [self.sommerfeld(fx, fy) for fx, fy in sommerfeld_forces]
+
+        S_Kxx, S_Kxy, S_Kyx, S_Kyy, S_Cxx, S_Cxy, S_Cyx, S_Cyy = S
+
+        Kxx = -S_Kxx * ((Auinitial_guess1[0] - Auinitial_guess2[0]) / epix_adm)
+        Kxy = -S_Kxy * ((Auinitial_guess3[0] - Auinitial_guess4[0]) / epiy_adm)
+        Kyx = -S_Kyx * ((Auinitial_guess1[1] - Auinitial_guess2[1]) / epix_adm)
+        Kyy = -S_Kyy * ((Auinitial_guess3[1] - Auinitial_guess4[1]) / epiy_adm)
+
+        Cxx = -S_Cxx * ((Auinitial_guess6[0] - Auinitial_guess5[0]) / epixpt_adm)
+        Cxy = -S_Cxy * ((Auinitial_guess8[0] - Auinitial_guess7[0]) / epiypt_adm)
+        Cyx = -S_Cyx * ((Auinitial_guess6[1] - Auinitial_guess5[1]) / epixpt_adm)
+        Cyy = -S_Cyy * ((Auinitial_guess8[1] - Auinitial_guess7[1]) / epiypt_adm)
+
+        kxx = k_scale * Kxx
+        kxy = k_scale * Kxy
+        kyx = k_scale * Kyx
+        kyy = k_scale * Kyy
+
+        cxx = c_scale * Cxx
+        cxy = c_scale * Cxy
+        cyx = c_scale * Cyx
+        cyy = c_scale * Cyy
 
         return (kxx, kxy, kyx, kyy), (cxx, cxy, cyx, cyy)
 
@@ -1369,433 +1000,147 @@ class THDCylindrical(BearingElement):
         Z = np.arange(Z1 + 0.5 * dZ, Z2, dZ)
         Zdim = Z * self.axial_length
 
-        Ytheta = np.zeros((self.n_pad, self.elements_circumferential))
-
         # Dimensionless
-        xr = initial_guess[0] * self.radial_clearance * np.cos(initial_guess[1])
-        yr = initial_guess[0] * self.radial_clearance * np.sin(initial_guess[1])
+        xr = initial_guess[0] * self.radial_clearance * math.cos(initial_guess[1])
+        yr = initial_guess[0] * self.radial_clearance * math.sin(initial_guess[1])
         Y = yr / self.radial_clearance
         X = xr / self.radial_clearance
 
-        nk = (self.elements_axial) * (self.elements_circumferential)
-
         gamma = 0.001
 
         wp = gamma * self.speed
 
-        Mat_coef = np.zeros((nk, nk))
-
-        bX = np.zeros((nk, 1)).astype(complex)
-
-        bY = np.zeros((nk, 1)).astype(complex)
-
-        hX = np.zeros((self.n_pad, self.elements_circumferential))
-
-        hY = np.zeros((self.n_pad, self.elements_circumferential))
-
-        PX = np.zeros(
-            (self.elements_axial, self.elements_circumferential, self.n_pad)
-        ).astype(complex)
-
-        PY = np.zeros(
-            (self.elements_axial, self.elements_circumferential, self.n_pad)
-        ).astype(complex)
-
         H = np.zeros((2, 2)).astype(complex)
 
-        n_p = 0
+        # The systems of all pads are built at once over the pad-major fields.
+        # Viscosity at the control volume faces, taken as the volume
+        # viscosity at the pad edges
+
+        M = np.pad(self.mu_l, ((0, 0), (1, 1), (1, 1)), mode="edge")
+        MU_E = 0.5 * (M[:, 1:-1, 1:-1] + M[:, 1:-1, 2:])
+        MU_W = 0.5 * (M[:, 1:-1, 1:-1] + M[:, 1:-1, :-2])
+        MU_N = 0.5 * (M[:, 1:-1, 1:-1] + M[:, 2:, 1:-1])
+        MU_S = 0.5 * (M[:, 1:-1, 1:-1] + M[:, :-2, 1:-1])
+
+        # Neighbor pressures, with antisymmetric ghost volumes outside
+        # the pad
+
+        P_g = np.pad(p, ((0, 0), (1, 1), (1, 1)), mode="symmetric")
+        P_g[..., 0] = -P_g[..., 0]
+        P_g[..., -1] = -P_g[..., -1]
+        P_g[:, 0, :] = -P_g[:, 0, :]
+        P_g[:, -1, :] = -P_g[:, -1, :]
+        P_E = P_g[:, 1:-1, 2:]
+        P_W = P_g[:, 1:-1, :-2]
+        P_N = P_g[:, 2:, 1:-1]
+        P_S = P_g[:, :-2, 1:-1]
+
+        # Stencil coefficients of the perturbed pressure system
+
+        trig_tables = self._trig_tables[:, :, np.newaxis, :]
+        cos_c, sin_c, cos_e, sin_e, cos_w, sin_w = trig_tables.swapaxes(0, 1)
+
+        hP = 1 - X * cos_c - Y * sin_c
+        he = 1 - X * cos_e - self.Y * sin_e
+        hw = 1 - X * cos_w - self.Y * sin_w
+
+        CE = (self.dZ * he**3) / (12 * MU_E * self.dY * self.betha_s**2)
+        CW = (self.dZ * hw**3) / (12 * MU_W * self.dY * self.betha_s**2)
+        CN = (self.dY * (self.journal_radius**2) * hP**3) / (
+            12 * MU_N * self.dZ * self.axial_length**2
+        )
+        CS = (self.dY * (self.journal_radius**2) * hP**3) / (
+            12 * MU_S * self.dZ * self.axial_length**2
+        )
+        CP = -(CE + CW + CN + CS)
 
-        for n_p in np.arange(self.n_pad):
+        # Derivatives of the film thickness with respect to X and Y
 
-            Ytheta[n_p, :] = np.arange(
-                self.thetaI[n_p] + (self.dtheta / 2), self.thetaF[n_p], self.dtheta
-            )
+        hXP = -cos_c
+        hXe = -cos_e
+        hXw = -cos_w
 
-            ki = 0
-            kj = 0
+        hYP = -sin_c
+        hYe = -sin_e
+        hYw = -sin_w
 
-            k = 0
+        hX = hXP[:, 0, :]
+        hY = hYP[:, 0, :]
 
-            for ii in np.arange((self.Z_I + 0.5 * self.dZ), self.Z_F, self.dZ):
-                for jj in np.arange(
-                    self.thetaI[n_p] + (self.dtheta / 2), self.thetaF[n_p], self.dtheta
-                ):
+        # Right-hand side of the perturbed pressure system
 
-                    hP = 1 - X * np.cos(jj) - Y * np.sin(jj)
-                    he = (
-                        1
-                        - X * np.cos(jj + 0.5 * self.dtheta)
-                        - self.Y * np.sin(jj + 0.5 * self.dtheta)
-                    )
-                    hw = (
-                        1
-                        - X * np.cos(jj - 0.5 * self.dtheta)
-                        - self.Y * np.sin(jj - 0.5 * self.dtheta)
-                    )
-                    hn = hP
-                    hs = hn
-
-                    hXP = -np.cos(jj)
-                    hXe = -np.cos(jj + 0.5 * self.dtheta)
-                    hXw = -np.cos(jj - 0.5 * self.dtheta)
-                    hXn = hXP
-                    hXs = hXn
-
-                    hYP = -np.sin(jj)
-                    hYe = -np.sin(jj + 0.5 * self.dtheta)
-                    hYw = -np.sin(jj - 0.5 * self.dtheta)
-                    hYn = hYP
-                    hYs = hYn
-
-                    if ki == 0:
-                        hX[n_p, kj] = hXP
-                        hY[n_p, kj] = hYP
-
-                    if kj == 0 and ki == 0:
-                        MU_e = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki, kj + 1, n_p]
-                        )
-                        MU_w = self.mu_l[ki, kj, n_p]
-                        MU_s = self.mu_l[ki, kj, n_p]
-                        MU_n = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki + 1, kj, n_p]
-                        )
-
-                        pE = p[ki, kj + 1, n_p]
-                        pW = -p[ki, kj, n_p]
-                        pN = p[ki + 1, kj, n_p]
-                        pS = -p[ki, kj, n_p]
-
-                    if kj == 0 and ki > 0 and ki < self.elements_axial - 1:
-                        MU_e = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki, kj + 1, n_p]
-                        )
-                        MU_w = self.mu_l[ki, kj, n_p]
-                        MU_s = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki - 1, kj, n_p]
-                        )
-                        MU_n = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki + 1, kj, n_p]
-                        )
-
-                        pE = p[ki, kj + 1, n_p]
-                        pW = -p[ki, kj, n_p]
-                        pN = p[ki + 1, kj, n_p]
-                        pS = p[ki - 1, kj, n_p]
-
-                    if kj == 0 and ki == self.elements_axial - 1:
-                        MU_e = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki, kj + 1, n_p]
-                        )
-                        MU_w = self.mu_l[ki, kj, n_p]
-                        MU_s = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki - 1, kj, n_p]
-                        )
-                        MU_n = self.mu_l[ki, kj, n_p]
-
-                        pE = p[ki, kj + 1, n_p]
-                        pW = -p[ki, kj, n_p]
-                        pN = -p[ki, kj, n_p]
-                        pS = p[ki - 1, kj, n_p]
-
-                    if ki == 0 and kj > 0 and kj < self.elements_circumferential - 1:
-                        MU_e = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki, kj + 1, n_p]
-                        )
-                        MU_w = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki, kj - 1, n_p]
-                        )
-                        MU_s = self.mu_l[ki, kj, n_p]
-                        MU_n = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki + 1, kj, n_p]
-                        )
-
-                        pE = p[ki, kj + 1, n_p]
-                        pW = p[ki, kj - 1, n_p]
-                        pN = p[ki + 1, kj, n_p]
-                        pS = -p[ki, kj, n_p]
-
-                    if (
-                        kj > 0
-                        and kj < self.elements_circumferential - 1
-                        and ki > 0
-                        and ki < self.elements_axial - 1
-                    ):
-                        MU_e = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki, kj + 1, n_p]
-                        )
-                        MU_w = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki, kj - 1, n_p]
-                        )
-                        MU_s = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki - 1, kj, n_p]
-                        )
-                        MU_n = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki + 1, kj, n_p]
-                        )
-
-                        pE = p[ki, kj + 1, n_p]
-                        pW = p[ki, kj - 1, n_p]
-                        pN = p[ki + 1, kj, n_p]
-                        pS = p[ki - 1, kj, n_p]
-
-                    if (
-                        ki == self.elements_axial - 1
-                        and kj > 0
-                        and kj < self.elements_circumferential - 1
-                    ):
-                        MU_e = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki, kj + 1, n_p]
-                        )
-                        MU_w = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki, kj - 1, n_p]
-                        )
-                        MU_s = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki - 1, kj, n_p]
-                        )
-                        MU_n = self.mu_l[ki, kj, n_p]
-
-                        pE = p[ki, kj + 1, n_p]
-                        pW = p[ki, kj - 1, n_p]
-                        pN = -p[ki, kj, n_p]
-                        pS = p[ki - 1, kj, n_p]
-
-                    if ki == 0 and kj == self.elements_circumferential - 1:
-                        MU_e = self.mu_l[ki, kj, n_p]
-                        MU_w = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki, kj - 1, n_p]
-                        )
-                        MU_s = self.mu_l[ki, kj, n_p]
-                        MU_n = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki + 1, kj, n_p]
-                        )
-
-                        pE = -p[ki, kj, n_p]
-                        pW = p[ki, kj - 1, n_p]
-                        pN = p[ki + 1, kj, n_p]
-                        pS = -p[ki, kj, n_p]
-
-                    if (
-                        kj == self.elements_circumferential - 1
-                        and ki > 0
-                        and ki < self.elements_axial - 1
-                    ):
-                        MU_e = self.mu_l[ki, kj, n_p]
-                        MU_w = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki, kj - 1, n_p]
-                        )
-                        MU_s = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki - 1, kj, n_p]
-                        )
-                        MU_n = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki + 1, kj, n_p]
-                        )
-
-                        pE = -p[ki, kj, n_p]
-                        pW = p[ki, kj - 1, n_p]
-                        pN = p[ki + 1, kj, n_p]
-                        pS = p[ki - 1, kj, n_p]
-
-                    if (
-                        kj == self.elements_circumferential - 1
-                        and ki == self.elements_axial - 1
-                    ):
-                        MU_e = self.mu_l[ki, kj, n_p]
-                        MU_w = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki, kj - 1, n_p]
-                        )
-                        MU_s = 0.5 * (
-                            self.mu_l[ki, kj, n_p] + self.mu_l[ki - 1, kj, n_p]
-                        )
-                        MU_n = self.mu_l[ki, kj, n_p]
-
-                        pE = -p[ki, kj, n_p]
-                        pW = p[ki, kj - 1, n_p]
-                        pN = -p[ki, kj, n_p]
-                        pS = p[ki - 1, kj, n_p]
-
-                    pP = p[ki, kj, n_p]
-
-                    CE = (self.dZ * he**3) / (12 * MU_e * self.dY * self.betha_s**2)
-                    CW = (self.dZ * hw**3) / (12 * MU_w * self.dY * self.betha_s**2)
-                    CN = (self.dY * (self.journal_radius**2) * hn**3) / (
-                        12 * MU_n * self.dZ * self.axial_length**2
-                    )
-                    CS = (self.dY * (self.journal_radius**2) * hs**3) / (
-                        12 * MU_s * self.dZ * self.axial_length**2
-                    )
+        BXE = -(self.dZ / (self.dY * self.betha_s**2)) * (
+            (3 * he**2 * hXe) / (12 * MU_E)
+        )
+        BYE = -(self.dZ / (self.dY * self.betha_s**2)) * (
+            (3 * he**2 * hYe) / (12 * MU_E)
+        )
+        BXW = -(self.dZ / (self.dY * self.betha_s**2)) * (
+            (3 * hw**2 * hXw) / (12 * MU_W)
+        )
+        BYW = -(self.dZ / (self.dY * self.betha_s**2)) * (
+            (3 * hw**2 * hYw) / (12 * MU_W)
+        )
+        BXN = -(
+            (self.journal_radius**2) * self.dY / (self.dZ * self.axial_length**2)
+        ) * ((3 * hP**2 * hXP) / (12 * MU_N))
+        BYN = -(
+            (self.journal_radius**2) * self.dY / (self.dZ * self.axial_length**2)
+        ) * ((3 * hP**2 * hYP) / (12 * MU_N))
+        BXS = -(
+            (self.journal_radius**2) * self.dY / (self.dZ * self.axial_length**2)
+        ) * ((3 * hP**2 * hXP) / (12 * MU_S))
+        BYS = -(
+            (self.journal_radius**2) * self.dY / (self.dZ * self.axial_length**2)
+        ) * ((3 * hP**2 * hYP) / (12 * MU_S))
+
+        BXP = -(BXE + BXW + BXN + BXS)
+        BYP = -(BYE + BYW + BYN + BYS)
+
+        BX = (
+            (self.dZ / (2 * self.betha_s)) * (hXe - hXw)
+            + (self.dY * self.dZ * 1j * gamma * hXP)
+            + BXE * P_E
+            + BXW * P_W
+            + BXN * P_N
+            + BXS * P_S
+            + BXP * p
+        )
+        BY = (
+            (self.dZ / (2 * self.betha_s)) * (hYe - hYw)
+            + (self.dY * self.dZ * 1j * gamma * hYP)
+            + BYE * P_E
+            + BYW * P_W
+            + BYN * P_N
+            + BYS * P_S
+            + BYP * p
+        )
 
-                    CP = -(CE + CW + CN + CS)
+        #    ###################### Solution of pressure field #######################
 
-                    BXE = -(self.dZ / (self.dY * self.betha_s**2)) * (
-                        (3 * he**2 * hXe) / (12 * MU_e)
-                    )
+        # The pads are not coupled, so their systems are assembled in a block
+        # diagonal matrix and solved together. Both perturbations share the
+        # coefficient matrix, so they are solved with a single factorization.
 
-                    BYE = -(self.dZ / (self.dY * self.betha_s**2)) * (
-                        (3 * he**2 * hYe) / (12 * MU_e)
-                    )
+        # Boundary conditions: null pressure at the pad edges
 
-                    BXW = -(self.dZ / (self.dY * self.betha_s**2)) * (
-                        (3 * hw**2 * hXw) / (12 * MU_w)
-                    )
+        CP[..., 0] = CP[..., 0] - CW[..., 0]
+        CP[..., -1] = CP[..., -1] - CE[..., -1]
+        CP[:, 0, :] = CP[:, 0, :] - CS[:, 0, :]
+        CP[:, -1, :] = CP[:, -1, :] - CN[:, -1, :]
 
-                    BYW = -(self.dZ / (self.dY * self.betha_s**2)) * (
-                        (3 * hw**2 * hYw) / (12 * MU_w)
-                    )
+        Mat_coef = _stencil_matrix(CP, CE, CW, CN, CS, self._pad_pattern)
 
-                    BXN = -(
-                        (self.journal_radius**2)
-                        * self.dY
-                        / (self.dZ * self.axial_length**2)
-                    ) * ((3 * hn**2 * hXn) / (12 * MU_n))
-
-                    BYN = -(
-                        (self.journal_radius**2)
-                        * self.dY
-                        / (self.dZ * self.axial_length**2)
-                    ) * ((3 * hn**2 * hYn) / (12 * MU_n))
-
-                    BXS = -(
-                        (self.journal_radius**2)
-                        * self.dY
-                        / (self.dZ * self.axial_length**2)
-                    ) * ((3 * hs**2 * hXs) / (12 * MU_s))
-
-                    BYS = -(
-                        (self.journal_radius**2)
-                        * self.dY
-                        / (self.dZ * self.axial_length**2)
-                    ) * ((3 * hs**2 * hYs) / (12 * MU_s))
-
-                    BXP = -(BXE + BXW + BXN + BXS)
-
-                    BYP = -(BYE + BYW + BYN + BYS)
-
-                    BX = (
-                        (self.dZ / (2 * self.betha_s)) * (hXe - hXw)
-                        + (self.dY * self.dZ * 1j * gamma * hXP)
-                        + BXE * pE
-                        + BXW * pW
-                        + BXN * pN
-                        + BXS * pS
-                        + BXP * pP
-                    )
+        pXY = spsolve(Mat_coef, np.column_stack([BX.ravel(), BY.ravel()]))
+        PX = pXY[:, 0].reshape(CP.shape)
+        PY = pXY[:, 1].reshape(CP.shape)
 
-                    BY = (
-                        (self.dZ / (2 * self.betha_s)) * (hYe - hYw)
-                        + (self.dY * self.dZ * 1j * gamma * hYP)
-                        + BYE * pE
-                        + BYW * pW
-                        + BYN * pN
-                        + BYS * pS
-                        + BYP * pP
-                    )
+        # Pads side by side along the circumferential direction
 
-                    k = k + 1
-                    bX[k - 1, 0] = BX
-                    bY[k - 1, 0] = BY
-
-                    if ki == 0 and kj == 0:
-                        Mat_coef[k - 1, k - 1] = CP - CS - CW
-                        Mat_coef[k - 1, k] = CE
-                        Mat_coef[k - 1, k + self.elements_circumferential - 1] = CN
-
-                    elif kj == 0 and ki > 0 and ki < self.elements_axial - 1:
-                        Mat_coef[k - 1, k - 1] = CP - CW
-                        Mat_coef[k - 1, k] = CE
-                        Mat_coef[k - 1, k - self.elements_circumferential - 1] = CS
-                        Mat_coef[k - 1, k + self.elements_circumferential - 1] = CN
-
-                    elif kj == 0 and ki == self.elements_axial - 1:
-                        Mat_coef[k - 1, k - 1] = CP - CN - CW
-                        Mat_coef[k - 1, k] = CE
-                        Mat_coef[k - 1, k - self.elements_circumferential - 1] = CS
-
-                    elif ki == 0 and kj > 0 and kj < self.elements_circumferential - 1:
-                        Mat_coef[k - 1, k - 1] = CP - CS
-                        Mat_coef[k - 1, k] = CE
-                        Mat_coef[k - 1, k - 2] = CW
-                        Mat_coef[k - 1, k + self.elements_circumferential - 1] = CN
-
-                    if (
-                        ki > 0
-                        and ki < self.elements_axial - 1
-                        and kj > 0
-                        and kj < self.elements_circumferential - 1
-                    ):
-                        Mat_coef[k - 1, k - 1] = CP
-                        Mat_coef[k - 1, k - 2] = CW
-                        Mat_coef[k - 1, k - self.elements_circumferential - 1] = CS
-                        Mat_coef[k - 1, k + self.elements_circumferential - 1] = CN
-                        Mat_coef[k - 1, k] = CE
-
-                    elif (
-                        ki == self.elements_axial - 1
-                        and kj > 0
-                        and kj < self.elements_circumferential - 1
-                    ):
-                        Mat_coef[k - 1, k - 1] = CP - CN
-                        Mat_coef[k - 1, k] = CE
-                        Mat_coef[k - 1, k - 2] = CW
-                        Mat_coef[k - 1, k - self.elements_circumferential - 1] = CS
-
-                    elif ki == 0 and kj == self.elements_circumferential - 1:
-                        Mat_coef[k - 1, k - 1] = CP - CE - CS
-                        Mat_coef[k - 1, k - 2] = CW
-                        Mat_coef[k - 1, k + self.elements_circumferential - 1] = CN
-
-                    elif (
-                        kj == self.elements_circumferential - 1
-                        and ki > 0
-                        and ki < self.elements_axial - 1
-                    ):
-                        Mat_coef[k - 1, k - 1] = CP - CE
-                        Mat_coef[k - 1, k - 2] = CW
-                        Mat_coef[k - 1, k - self.elements_circumferential - 1] = CS
-                        Mat_coef[k - 1, k + self.elements_circumferential - 1] = CN
-
-                    elif (
-                        ki == self.elements_axial - 1
-                        and kj == self.elements_circumferential - 1
-                    ):
-                        Mat_coef[k - 1, k - 1] = CP - CE - CN
-                        Mat_coef[k - 1, k - 2] = CW
-                        Mat_coef[k - 1, k - self.elements_circumferential - 1] = CS
-
-                    kj = kj + 1
-
-                kj = 0
-                ki = ki + 1
-
-                #    ###################### Solution of pressure field #######################
-
-            pX = np.linalg.solve(Mat_coef, bX)
-
-            pY = np.linalg.solve(Mat_coef, bY)
-
-            cont = 0
-
-            for i in np.arange(self.elements_axial):
-                for j in np.arange(self.elements_circumferential):
-
-                    PX[i, j, n_p] = pX[cont]
-                    PY[i, j, n_p] = pY[cont]
-                    cont = cont + 1
-
-        PPlotX = np.zeros(
-            (self.elements_axial, self.elements_circumferential * self.n_pad)
-        ).astype(complex)
-        PPlotY = np.zeros(
-            (self.elements_axial, self.elements_circumferential * self.n_pad)
-        ).astype(complex)
-
-        i = 0
-        for i in range(self.elements_axial):
-
-            PPlotX[i] = PX[i, :, :].ravel("F")
-            PPlotY[i] = PY[i, :, :].ravel("F")
-
-        Ytheta = Ytheta.flatten()
+        PPlotX = PX.transpose(1, 0, 2).reshape(self.elements_axial, -1)
+        PPlotY = PY.transpose(1, 0, 2).reshape(self.elements_axial, -1)
+
+        Ytheta = self._Ytheta_c.flatten()
 
         PPlotXdim = (
             PPlotX
@@ -1820,13 +1165,13 @@ class THDCylindrical(BearingElement):
 
         aux_intYY = PPlotYdim * hY.T
 
-        H[0, 0] = -np.trapz(np.trapz(aux_intXX, Ytheta * self.journal_radius), Zdim)
-
-        H[0, 1] = -np.trapz(np.trapz(aux_intXY, Ytheta * self.journal_radius), Zdim)
+        # Trapezoidal integration over the bearing surface
 
-        H[1, 0] = -np.trapz(np.trapz(aux_intYX, Ytheta * self.journal_radius), Zdim)
+        w_theta = _trapezoid_weights(Ytheta * self.journal_radius)
+        w_z = _trapezoid_weights(Zdim)
 
-        H[1, 1] = -np.trapz(np.trapz(aux_intYY, Ytheta * self.journal_radius), Zdim)
+        aux_int = np.stack([aux_intXX, aux_intXY, aux_intYX, aux_intYY])
+        H[:] = -np.einsum("kij,i,j->k", aux_int, w_z, w_theta).reshape(2, 2)
 
         K = np.real(H)
         C = np.imag(H) / wp
@@ -1843,8 +1188,9 @@ class THDCylindrical(BearingElement):
 
         return (kxx, kxy, kyx, kyy), (cxx, cxy, cyx, cyy)
 
-    def _score(self, x, print_progress=False):
-        """This method used to set the objective function of minimize optimization.
+    def _residual(self, x, print_progress=False):
+        """This method is used to set the residual of the least squares
+        optimization.
 
         Parameters
         ----------
@@ -1854,14 +1200,15 @@ class THDCylindrical(BearingElement):
 
         Returns
         -------
-        Score coefficient.
+        Force imbalance in x and y directions normalized by the applied load.
 
         """
         Fhx, Fhy = self._forces(x, None, None, None)
-        score = np.sqrt(
-            ((self.load_x_direction + Fhx) ** 2) + ((self.load_y_direction + Fhy) ** 2)
-        )
+        residual = np.array(
+            [self.load_x_direction + Fhx, self.load_y_direction + Fhy]
+        ) / math.hypot(self.load_x_direction, self.load_y_direction)
         if print_progress:
+            score = np.sum(residual**2)
             print(f"Score: ", score)
             print("============================================")
             print(f"Force x direction: ", Fhx)
@@ -1869,7 +1216,24 @@ class THDCylindrical(BearingElement):
             print(f"Force y direction: ", Fhy)
             print("")
 
-        return score
+        return residual
+
+    def _score(self, x, print_progress=False):
+        """This method used to set the objective function of minimize optimization.
+
+        Parameters
+        ----------
+        x: array
+           Balanced Force expression between the load aplied in bearing and the
+           resultant force provide by oil film.
+
+        Returns
+        -------
+        Score coefficient. Magnitude of the force imbalance, in newton.
+
+        """
+        W = math.hypot(self.load_x_direction, self.load_y_direction)
+        return W * math.hypot(*self._residual(x, print_progress))
 
     def sommerfeld(self, force_x, force_y):
         """Calculate the sommerfeld number. This dimensionless number is used to
@@ -1896,14 +1260,14 @@ class THDCylindrical(BearingElement):
             ) / (
                 np.pi
                 * (self.radial_clearance**2)
-                * np.sqrt((self.load_x_direction**2) + (self.load_y_direction**2))
+                * math.hypot(self.load_x_direction, self.load_y_direction)
             )
 
         elif self.sommerfeld_type == 2:
             S = 1 / (
                 2
                 * ((self.axial_length / (2 * self.journal_radius)) ** 2)
-                * (np.sqrt((force_x**2) + (force_y**2)))
+                * math.hypot(force_x, force_y)
             )
 
         Ss = S * ((self.axial_length / (2 * self.journal_radius)) ** 2)
@@ -1911,6 +1275,133 @@ class THDCylindrical(BearingElement):
         return Ss
 
 
+def _trapezoid_weights(x):
+    """Weights of the trapezoidal rule over the sample points x.
+
+    The integral of samples y taken at x is ``np.dot(y, weights)``, which
+    lets a double integral be reduced in a single ``np.einsum`` call.
+
+    Parameters
+    ----------
+    x : array
+        Sample points, in increasing order.
+
+    Returns
+    -------
+    weights : array
+        Trapezoidal weight of each sample point.
+    """
+    dx = np.diff(x)
+    weights = np.zeros(len(x))
+    weights[:-1] += 0.5 * dx
+    weights[1:] += 0.5 * dx
+
+    return weights
+
+
+@lru_cache(maxsize=None)
+def _stencil_pattern(n_z, n_theta, n_blocks=1):
+    """Sparsity pattern of the five-point stencil coefficient matrix.
+
+    The control volumes are numbered row by row, so the east and west
+    neighbors are one position apart and the north and south neighbors are
+    one row of volumes apart. The pattern depends only on the mesh, so it is
+    computed once per mesh size and shared by every assembly of the pressure
+    and temperature systems of the bearings using it. The returned arrays
+    are read-only for that reason.
+
+    Parameters
+    ----------
+    n_z : int
+        Number of volumes along the axial direction.
+    n_theta : int
+        Number of volumes along the circumferential direction.
+    n_blocks : int, optional
+        Number of uncoupled meshes (e.g. the pads) numbered one after the
+        other, giving a block diagonal matrix.
+        Default is 1.
+
+    Returns
+    -------
+    pattern : tuple
+        CSR column indices and row pointers, and the permutation that sorts
+        the stacked central, east, west, north and south coefficients into
+        CSR order.
+    """
+    nk = n_blocks * n_z * n_theta
+    index = np.arange(nk).reshape(n_blocks, n_z, n_theta)
+
+    rows = np.concatenate(
+        (
+            index.ravel(),
+            index[..., :-1].ravel(),
+            index[..., 1:].ravel(),
+            index[:, :-1, :].ravel(),
+            index[:, 1:, :].ravel(),
+        )
+    )
+    cols = np.concatenate(
+        (
+            index.ravel(),
+            index[..., 1:].ravel(),
+            index[..., :-1].ravel(),
+            index[:, 1:, :].ravel(),
+            index[:, :-1, :].ravel(),
+        )
+    )
+
+    order = np.lexsort((cols, rows))
+    indices = cols[order]
+    indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=nk))))
+
+    for array in (indices, indptr, order):
+        array.setflags(write=False)
+
+    return indices, indptr, order
+
+
+def _stencil_matrix(CP, CE, CW, CN, CS, pattern, out=None):
+    """Assemble the sparse coefficient matrix of a five-point stencil.
+
+    Parameters
+    ----------
+    CP, CE, CW, CN, CS : array
+        Coefficients of the central, east, west, north and south volumes.
+        Their shape is (elements_axial, elements_circumferential), or
+        (n_blocks, elements_axial, elements_circumferential) for a block
+        diagonal pattern. The boundary conditions must be already included
+        in CP, since the neighbors outside the mesh are discarded.
+    pattern : tuple
+        Sparsity pattern returned by _stencil_pattern for this mesh.
+    out : scipy.sparse.csr_matrix, optional
+        Matrix previously returned by this function for the same mesh. Its
+        values are overwritten in place instead of building a new matrix.
+
+    Returns
+    -------
+    Mat_coef : scipy.sparse.csr_matrix
+        Coefficient matrix of the linear system.
+    """
+    indices, indptr, order = pattern
+    nk = CP.size
+
+    data = np.concatenate(
+        (
+            CP.ravel(),
+            CE[..., :-1].ravel(),
+            CW[..., 1:].ravel(),
+            CN[..., :-1, :].ravel(),
+            CS[..., 1:, :].ravel(),
+        )
+    )
+
+    if out is not None:
+        np.take(data, order, out=out.data)
+        return out
+
+    return csr_matrix((data[order], indices, indptr), shape=(nk, nk))
+
+
 def cylindrical_bearing_example():
     """Create an example of a cylindrical bearing with termo hydrodynamic effects.
     This function returns pressure and temperature field and dynamic coefficient.
@@ -884,6 +884,94 @@ class Rotor(object):
 
         return results
 
+    def prepare_sparse_pattern(self, elements=None):
+        """Global coordinate (COO) indices of the element matrices.
+
+        The connectivity of the rotor does not change between evaluations of the
+        global matrices (or between the samples of a stochastic rotor built with
+        the same elements layout), so the position of each element matrix entry in
+        the global matrix is computed only once. Assembling a global matrix is then
+        reduced to summing the flattened element matrices into these positions.
+
+        Parameters
+        ----------
+        elements : list, optional
+            Elements to be assembled. Default is the list of all rotor elements,
+            in which case the pattern is cached in the rotor.
+
+        Returns
+        -------
+        row_idx : np.ndarray
+            Global row index of each entry of the flattened element matrices.
+        col_idx : np.ndarray
+            Global column index of each entry of the flattened element matrices.
+        offsets : np.ndarray
+            Position of the first entry of each element in row_idx and col_idx.
+            The last value is the total number of entries.
+
+        Examples
+        --------
+        >>> rotor = rotor_example()
+        >>> row_idx, col_idx, offsets = rotor.prepare_sparse_pattern()
+        >>> offsets[:3]
+        array([  0,  64, 128])
+        """
+        cache = elements is None
+        if cache:
+            try:
+                return self._sparse_pattern
+            except AttributeError:
+                elements = self.elements
+
+        dofs = [np.array(list(elm.dof_global_index.values())) for elm in elements]
+        sizes = np.array([len(d) for d in dofs])
+        offsets = np.concatenate([[0], np.cumsum(sizes**2)])
+        if dofs:
+            row_idx = np.concatenate([np.repeat(d, len(d)) for d in dofs])
+            col_idx = np.concatenate([np.tile(d, len(d)) for d in dofs])
+        else:
+            row_idx = col_idx = np.array([], dtype=int)
+
+        pattern = (row_idx, col_idx, offsets)
+        if cache:
+            self._sparse_pattern = pattern
+
+        return pattern
+
+    def _assemble(self, matrices, pattern=None):
+        """Assemble element matrices into a global matrix.
+
+        Parameters
+        ----------
+        matrices : list
+            Element matrices, in the same order as the elements of the pattern.
+        pattern : tuple, optional
+            Pattern returned by prepare_sparse_pattern. Default is the pattern of
+            all rotor elements.
+
+        Returns
+        -------
+        global_matrix : np.ndarray
+            The assembled (ndof, ndof) matrix.
+        """
+        if pattern is None:
+            pattern = self.prepare_sparse_pattern()
+        row_idx, col_idx, _ = pattern
+
+        if not matrices:
+            return np.zeros((self.ndof, self.ndof))
+
+        data = np.concatenate([np.ravel(m) for m in matrices])
+        flat_idx = row_idx * self.ndof + col_idx
+        size = self.ndof**2
+        global_matrix = np.bincount(flat_idx, weights=data.real, minlength=size)
+        if np.iscomplexobj(data):
+            global_matrix = global_matrix + 1j * np.bincount(
+                flat_idx, weights=data.imag, minlength=size
+            )
+
+        return global_matrix.reshape(self.ndof, self.ndof)
+
     def M(self):
         """Mass matrix for an instance of a rotor.
 
@@ -901,11 +989,7 @@ class Rotor(object):
                [ 0.        , -0.04931719,  0.00231392,  0.        ],
                [ 0.04931719,  0.        ,  0.        ,  0.00231392]])
         """
-        M0 = np.zeros((self.ndof, self.ndof))
-
-        for elm in self.elements:
-            dofs = list(elm.dof_global_index.values())
-            M0[np.ix_(dofs, dofs)] += elm.M()
+        M0 = self._assemble([elm.M() for elm in self.elements])
 
         return M0
 
@@ -931,14 +1015,13 @@ class Rotor(object):
                [ 0., -6.,  1.,  0.],
                [ 6.,  0.,  0.,  1.]])
         """
-        K0 = np.zeros((self.ndof, self.ndof))
-
+        matrices = []
         for elm in self.elements:
-            dofs = list(elm.dof_global_index.values())
             try:
-                K0[np.ix_(dofs, dofs)] += elm.K(frequency)
+                matrices.append(elm.K(frequency))
             except TypeError:
-                K0[np.ix_(dofs, dofs)] += elm.K()
+                matrices.append(elm.K())
+        K0 = self._assemble(matrices)
 
         return K0
 
@@ -968,12 +1051,15 @@ class Rotor(object):
 
         if self.number_dof == 6:
 
-            for elm in self.shaft_elements:
-                dofs = list(elm.dof_global_index.values())
-                try:
-                    Kst0[np.ix_(dofs, dofs)] += elm.Kst()
-                except TypeError:
-                    Kst0[np.ix_(dofs, dofs)] += elm.Kst()
+            # Kst is evaluated at every speed, so the pattern of the shaft
+            # elements is cached alongside the one of all elements
+            try:
+                pattern = self._shaft_sparse_pattern
+            except AttributeError:
+                pattern = self.prepare_sparse_pattern(self.shaft_elements)
+                self._shaft_sparse_pattern = pattern
+
+            Kst0 = self._assemble([elm.Kst() for elm in self.shaft_elements], pattern)
 
         return Kst0
 
@@ -999,14 +1085,13 @@ class Rotor(object):
                [0., 0., 0., 0.],
                [0., 0., 0., 0.]])
         """
-        C0 = np.zeros((self.ndof, self.ndof))
-
+        matrices = []
         for elm in self.elements:
-            dofs = list(elm.dof_global_index.values())
             try:
-                C0[np.ix_(dofs, dofs)] += elm.C(frequency)
+                matrices.append(elm.C(frequency))
             except TypeError:
-                C0[np.ix_(dofs, dofs)] += elm.C()
+                matrices.append(elm.C())
+        C0 = self._assemble(matrices)
 
         return C0
 
@@ -1027,11 +1112,7 @@ class Rotor(object):
                [ 0.00022681,  0.        ,  0.        ,  0.0001524 ],
                [ 0.        ,  0.00022681, -0.0001524 ,  0.        ]])
         """
-        G0 = np.zeros((self.ndof, self.ndof))
-
-        for elm in self.elements:
-            dofs = list(elm.dof_global_index.values())
-            G0[np.ix_(dofs, dofs)] += elm.G()
+        G0 = self._assemble([elm.G() for elm in self.elements])
 
         return G0
 
@@ -1068,10 +1149,11 @@ class Rotor(object):
         Z = np.zeros((self.ndof, self.ndof))
         I = np.eye(self.ndof)
 
+        # the stiffness and damping terms share a single factorization of M
         # fmt: off
         A = np.vstack(
             [np.hstack([Z, I]),
-             np.hstack([la.solve(-self.M(), self.K(frequency) + self.Kst()*speed), la.solve(-self.M(), (self.C(frequency) + self.G() * speed))])])
+             la.solve(-self.M(), np.hstack([self.K(frequency) + self.Kst()*speed, self.C(frequency) + self.G() * speed]))])
         # fmt: on
 
         return A
@@ -1321,9 +1403,14 @@ class Rotor(object):
         if frequency is None:
             frequency = speed
         A = self.A(speed=speed, frequency=frequency)
+
+        # the mass matrix is assembled and factorized once for B, C and D
+        M_lu = la.lu_factor(self.M())
+        M_inv_B2 = la.lu_solve(M_lu, B2)
+
         # fmt: off
         B = np.vstack([Z,
-                       la.solve(self.M(), B2)])
+                       M_inv_B2])
         # fmt: on
 
         # y = Cx + Du
@@ -1333,9 +1420,9 @@ class Rotor(object):
         Ca = Z
 
         # fmt: off
-        C = np.hstack((Cd - Ca @ la.solve(self.M(), self.K(frequency)), Cv - Ca @ la.solve(self.M(), self.C(frequency))))
+        C = np.hstack((Cd - Ca @ la.lu_solve(M_lu, self.K(frequency)), Cv - Ca @ la.lu_solve(M_lu, self.C(frequency))))
         # fmt: on
-        D = Ca @ la.solve(self.M(), B2)
+        D = Ca @ M_inv_B2
 
         sys = signal.lti(A, B, C, D)
 
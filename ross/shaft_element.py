@@ -5,6 +5,7 @@ shaft. There're 2 options, an element with 8 or 12 degrees of freedom.
 """
 import inspect
 import os
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -519,134 +520,19 @@ class ShaftElement(Element):
                [ 0.        , -0.86197637,  0.08667495,  0.        ],
                [ 0.86197637,  0.        ,  0.        ,  0.08667495]])
         """
-        phi = self.phi
-        L = self.L
-        a1 = self.a1
-        a2 = self.a2
-        b1 = self.b1
-        b2 = self.b2
-        delta = self.delta
-        gama = self.gama
-        Ie_l = self.Ie_l
-        A_l = self.A_l
-
-        m1 = (
-            (468 + 882 * phi + 420 * phi**2)
-            + a1 * (108 + 210 * phi + 105 * phi**2)
-            + b1 * (38 + 78 * phi + 42 * phi**2)
-        )
-        m2 = (
-            (66 + 115.5 * phi + 52.5 * phi**2)
-            + a1 * (21 + 40.5 * phi + 21 * phi**2)
-            + b1 * (8.5 + 18 * phi + 10.5 * phi**2)
-        )
-        m3 = (
-            (162 + 378 * phi + 210 * phi**2)
-            + a1 * (81 + 189 * phi + 105 * phi**2)
-            + b1 * (46 + 111 * phi + 63 * phi**2)
-        )
-        m4 = (
-            (39 + 94.5 * phi + 52.5 * phi**2)
-            + a1 * (18 + 40.5 * phi + 21 * phi**2)
-            + b1 * (9.5 + 21 * phi + 10.5 * phi**2)
-        )
-        m5 = (
-            (12 + 21 * phi + 10.5 * phi**2)
-            + a1 * (4.5 + 9 * phi + 5.25 * phi**2)
-            + b1 * (2 + 4.5 * phi + 3 * phi**2)
-        )
-        m6 = (
-            (39 + 94.5 * phi + 52.5 * phi**2)
-            + a1 * (21 + 54 * phi + 31.5 * phi**2)
-            + b1 * (12.5 + 34.5 * phi + 21 * phi**2)
-        )
-        m7 = (
-            (9 + 21 * phi + 10.5 * phi**2)
-            + a1 * (4.5 + 10.5 * phi + 5.25 * phi**2)
-            + b1 * (2.5 + 6 * phi + 3 * phi**2)
+        M = self.material.rho * _mass_template(
+            self.L,
+            self.phi,
+            self.a1,
+            self.a2,
+            self.b1,
+            self.b2,
+            self.gama,
+            self.delta,
+            self.A_l,
+            self.Ie_l,
+            self.rotary_inertia,
         )
-        m8 = (
-            (468 + 882 * phi + 420 * phi**2)
-            + a1 * (360 + 672 * phi + 315 * phi**2)
-            + b1 * (290 + 540 * phi + 252 * phi**2)
-        )
-        m9 = (
-            (66 + 115.5 * phi + 52.5 * phi**2)
-            + a1 * (45 + 75 * phi + 31.5 * phi**2)
-            + b1 * (32.5 + 52.5 * phi + 21 * phi**2)
-        )
-        m10 = (
-            (12 + 21 * phi + 10.5 * phi**2)
-            + a1 * (7.5 + 12 * phi + 5.25 * phi**2)
-            + b1 * (5 + 7.5 * phi + 3 * phi**2)
-        )
-
-        # fmt: off
-        Mt = np.array([
-                [   m1,     0,        0,    L*m2,     m3,     0,        0,    -L*m4],
-                [    0,    m1,    -L*m2,       0,      0,    m3,     L*m4,        0],
-                [    0, -L*m2,  L**2*m5,       0,      0, -L*m6, -L**2*m7,        0],
-                [ L*m2,     0,        0,  L**2*m5,  L*m6,     0,        0, -L**2*m7],
-                [   m3,     0,        0,     L*m6,    m8,     0,        0,    -L*m9],
-                [    0,    m3,    -L*m6,        0,     0,    m8,     L*m9,        0],
-                [    0,  L*m4, -L**2*m7,        0,     0,  L*m9, L**2*m10,        0],
-                [-L*m4,     0,        0, -L**2*m7, -L*m9,     0,        0, L**2*m10],
-        ])
-        # fmt: on
-        M = self.material.rho * A_l * L * Mt / (1260 * (1 + phi) ** 2)
-
-        if self.rotary_inertia:
-            # fmt: off
-            m11 = 252 + 126 * a2 + 72 * b2 + 45 * gama + 30 * delta
-            m12 = (
-                21 - 105 * phi
-                + a2 * (21 - 42 * phi)
-                + b2 * (15 - 21 * phi)
-                + gama * (10.5 - 12 * phi)
-                + delta * (7.5 - 7.5 * phi)
-            )
-            m13 = (
-                21 - 105 * phi
-                - 63 * a2 * phi
-                - b2 * (6 + 42 * phi)
-                - gama * (7.5 + 30 * phi)
-                - delta * (7.5 + 22.5 * phi)
-            )
-            m14 = (
-                28 + 35 * phi + 70 * phi ** 2
-                + a2 * (7 - 7 * phi + 17.5 * phi ** 2)
-                + b2 * (4 - 7 * phi + 7 * phi ** 2)
-                + gama * (2.75 - 5 * phi + 3.5 * phi ** 2)
-                + delta * (2 - 3.5 * phi + 2 * phi ** 2)
-            )
-            m15 = (
-                7 + 35 * phi - 35 * phi ** 2
-                + a2 * (3.5 + 17.5 * phi - 17.5 * phi ** 2)
-                + b2 * (3 + 10.5 * phi - 10.5 * phi ** 2)
-                + gama * (2.75 + 7 * phi - 7 * phi ** 2)
-                + delta * (2.5 + 5 * phi - 5 * phi ** 2)
-            )
-            m16 = (
-                28 + 35 * phi + 70 * phi ** 2
-                + a2 * (21 + 42 * phi + 52.5 * phi ** 2)
-                + b2 * (18 + 42 * phi + 42 * phi ** 2)
-                + gama * (16.25 + 40 * phi + 35 * phi ** 2)
-                + delta * (15 + 37.5 * phi + 30 * phi ** 2)
-            )
-
-            Mr = np.array([
-                    [  m11,      0,         0,     L*m12,   -m11,     0,         0,     L*m13],
-                    [    0,    m11,    -L*m12,         0,      0,  -m11,    -L*m13,         0],
-                    [    0, -L*m12,  L**2*m14,         0,      0, L*m12, -L**2*m15,         0],
-                    [L*m12,      0,         0,  L**2*m14, -L*m12,     0,         0, -L**2*m15],
-                    [ -m11,      0,         0,    -L*m12,    m11,     0,         0,    -L*m13],
-                    [    0,   -m11,     L*m12,         0,      0,   m11,     L*m13,         0],
-                    [    0, -L*m13, -L**2*m15,         0,      0, L*m13,  L**2*m16,         0],
-                    [L*m13,      0,         0, -L**2*m15, -L*m13,     0,         0,  L**2*m16],
-            ])
-            # fmt: on
-            Mr = self.material.rho * Ie_l * Mr / (210 * L * (1 + phi) ** 2)
-            M = M + Mr
 
         return M
 
@@ -672,121 +558,21 @@ class ShaftElement(Element):
                [  0.        , -41.29754659,  12.23526375,   0.        ],
                [ 41.29754659,   0.        ,   0.        ,  12.23526375]])
         """
-        L = self.L
-        phi = self.phi
-        a1 = self.a1
-        a2 = self.a2
-        b1 = self.b1
-        b2 = self.b2
-        delta = self.delta
-        gama = self.gama
-        A = self.A
-        A_l = self.A_l
-        Ie_l = self.Ie_l
-        E = self.material.E
-
-        # fmt: off
-        k1 = 1260 + 630 * a2 + 504 * b2 + 441 * gama + 396 * delta
-        k2 = (
-            630
-            + 210 * a2
-            + 147 * b2
-            + 126 * gama
-            + 114 * delta
-            - phi * (105 * a2 + 105 * b2 + 94.5 * gama + 84 * delta)
-        )
-        k3 = (
-            630
-            + 420 * a2
-            + 357 * b2
-            + 315 * gama
-            + 282 * delta
-            + phi * (105 * a2 + 105 * b2 + 94.5 * gama + 84 * delta)
-        )
-        k4 = (
-            420 + 210 * phi + 105 * phi ** 2
-            + a2 * (105 + 52.5 * phi ** 2)
-            + b2 * (56 - 35 * phi + 35 * phi ** 2)
-            + gama * (42 - 42 * phi + 26.25 * phi ** 2)
-            + delta * (36 - 42 * phi + 21 * phi ** 2)
-        )
-        k5 = (
-            210 - 210 * phi - 105 * phi ** 2
-            + a2 * (105 - 105 * phi - 52.5 * phi ** 2)
-            + b2 * (91 - 70 * phi - 35 * phi ** 2)
-            + gama * (84 - 52.5 * phi - 26.25 * phi ** 2)
-            + delta * (78 - 42 * phi - 21 * phi ** 2)
+        K, Kaxial, Ktorque = _stiffness_templates(
+            self.L,
+            self.phi,
+            self.a1,
+            self.a2,
+            self.b1,
+            self.b2,
+            self.gama,
+            self.delta,
+            self.A,
+            self.A_l,
+            self.Ie,
+            self.Ie_l,
         )
-        k6 = (
-            420 + 210 * phi + 105 * phi ** 2
-            + a2 * (315 + 210 * phi + 52.5 * phi ** 2)
-            + b2 * (266 + 175 * phi + 35 * phi ** 2)
-            + gama * (231 + 147 * phi + 26.25 * phi ** 2)
-            + delta * (204 + 126 * phi + 21 * phi ** 2)
-        )
-        k7 = 12 + 6 * a1 + 4 * b1
-        k8 = 6 + 3 * a1 + 2 * b1
-        k9 = 3 + 1.5 * a1 + b1
-
-        K1 = np.array([
-            [  k1,     0,       0,    L*k2,   -k1,    0,       0,    L*k3],
-            [   0,    k1,   -L*k2,       0,     0,  -k1,   -L*k3,       0],
-            [   0, -L*k2, L**2*k4,       0,     0, L*k2, L**2*k5,       0],
-            [L*k2,     0,       0, L**2*k4, -L*k2,    0,       0, L**2*k5],
-            [ -k1,     0,       0,   -L*k2,    k1,    0,       0,   -L*k3],
-            [   0,   -k1,    L*k2,       0,     0,   k1,    L*k3,       0],
-            [   0, -L*k3, L**2*k5,       0,     0, L*k3, L**2*k6,       0],
-            [L*k3,     0,       0, L**2*k5, -L*k3,    0,       0, L**2*k6],
-        ])
-
-        K2 = np.array([
-            [  k7,     0,       0,    L*k8,   -k7,     0,       0,    L*k8],
-            [   0,    k7,   -L*k8,       0,     0,   -k7,   -L*k8,       0],
-            [   0, -L*k8, L**2*k9,       0,     0,  L*k8, L**2*k9,       0],
-            [L*k8,     0,       0, L**2*k9, -L*k8,     0,       0, L**2*k9],
-            [ -k7,     0,       0,   -L*k8,    k7,     0,       0,   -L*k8],
-            [   0,   -k7,    L*k8,       0,     0,    k7,    L*k8,       0],
-            [   0, -L*k8, L**2*k9,       0,     0,  L*k8, L**2*k9,       0],
-            [L*k8,     0,       0, L**2*k9, -L*k8,     0,       0, L**2*k9],
-        ])
-
-        K = E * L**(-3) * (1 + phi)**(-2) * (K1 * Ie_l/105 + K2 * self.Ie * phi * A_l / A)
-
-        # axial force
-        k10 = 36 + 60 * phi + 30 * phi ** 2
-        k11 = L * 3
-        k12 = L ** 2 * (4 + 5 * phi + 2.5 * phi ** 2)
-        k13 = L ** 2 * (1 + 5 * phi + 2.5 * phi ** 2)
-
-        Kaxial = np.array([
-            [ k10,    0,    0,  k11, -k10,    0,    0,  k11],
-            [   0,  k10, -k11,    0,    0, -k10, -k11,    0],
-            [   0, -k11,  k12,    0,    0,  k11, -k13,    0],
-            [ k11,    0,    0,  k12, -k11,    0,    0, -k13],
-            [-k10,    0,    0, -k11,  k10,    0,    0, -k11],
-            [   0, -k10,  k11,    0,    0,  k10,  k11,    0],
-            [   0, -k11, -k13,    0,    0,  k11,  k12,    0],
-            [ k11,    0,    0, -k13, -k11,    0,    0,  k12],
-        ])
-
-        Kaxial *= self.axial_force / (30 * L * (1 + phi) ** 2)
-        K += Kaxial
-
-        # torque
-        Ktorque = np.array([
-            [   0,    0,    1,    0,    0,    0,   -1,    0],
-            [   0,    0,    0,    1,    0,    0,    0,   -1],
-            [   1,    0,    0, -L/2,   -1,    0,    0,  L/2],
-            [   0,    1,  L/2,    0,    0,   -1, -L/2,    0],
-            [   0,    0,   -1,    0,    0,    0,    1,    0],
-            [   0,    0,    0,   -1,    0,    0,    0,    1],
-            [  -1,    0,    0, -L/2,    1,    0,    0,  L/2],
-            [   0,   -1,  L/2,    0,    0,    1, -L/2,    0],
-        ])
-
-        Ktorque *= self.torque / L
-        K += Ktorque
-        # fmt: on
+        K = self.material.E * K + self.axial_force * Kaxial + self.torque * Ktorque
 
         return K
 
@@ -840,64 +626,15 @@ class ShaftElement(Element):
                [ 0.        ,  0.01085902, -0.0067206 ,  0.        ]])
         """
         if self.gyroscopic:
-            phi = self.phi
-            L = self.L
-            a2 = self.a2
-            b2 = self.b2
-            delta = self.delta
-            gama = self.gama
-            Ie_l = self.Ie_l
-
-            # fmt: off
-            g1 = 252 + 126 * a2 + 72 * b2 + 45 * gama + 30 * delta
-            g2 = (
-                21 - 105 * phi
-                + a2 * (21 - 42 * phi)
-                + b2 * (15 - 21 * phi)
-                + gama * (10.5 - 12 * phi)
-                + delta * (7.5 - 7.5 * phi)
-            )
-            g3 = (
-                21 - 105 * phi
-                - 63 * a2 * phi
-                - b2 * (6 + 42 * phi)
-                - gama * (7.5 + 30 * phi)
-                - delta * (7.5 + 22.5 * phi)
-            )
-            g4 = (
-                28 + 35 * phi + 70 * phi ** 2
-                + a2 * (7 - 7 * phi + 17.5 * phi ** 2)
-                + b2 * (4 - 7 * phi + 7 * phi ** 2)
-                + gama * (2.75 - 5 * phi + 3.5 * phi ** 2)
-                + delta * (2 - 3.5 * phi + 2 * phi ** 2)
+            G = self.material.rho * _gyroscopic_template(
+                self.L,
+                self.phi,
+                self.a2,
+                self.b2,
+                self.gama,
+                self.delta,
+                self.Ie_l,
             )
-            g5 = (
-                7 + 35 * phi - 35 * phi ** 2
-                + a2 * (3.5 + 17.5 * phi - 17.5 * phi ** 2)
-                + b2 * (3 + 10.5 * phi - 10.5 * phi ** 2)
-                + gama * (2.75 + 7 * phi - 7 * phi ** 2)
-                + delta * (2.5 + 5 * phi - 5 * phi ** 2)
-            )
-            g6 = (
-                28 + 35 * phi + 70 * phi ** 2
-                + a2 * (21 + 42 * phi + 52.5 * phi ** 2)
-                + b2 * (18 + 42 * phi + 42 * phi ** 2)
-                + gama * (16.25 + 40 * phi + 35 * phi ** 2)
-                + delta * (15 + 37.5 * phi + 30 * phi ** 2)
-            )
-
-            G = np.array([
-                    [   0,    g1,    -L*g2,        0,     0,   -g1,    -L*g3,        0],
-                    [ -g1,     0,        0,    -L*g2,    g1,     0,        0,    -L*g3],
-                    [L*g2,     0,        0,  L**2*g4, -L*g2,     0,        0, -L**2*g5],
-                    [   0,  L*g2, -L**2*g4,        0,     0, -L*g2,  L**2*g5,        0],
-                    [   0,   -g1,     L*g2,        0,     0,    g1,     L*g3,        0],
-                    [  g1,     0,        0,     L*g2,   -g1,     0,        0,     L*g3],
-                    [L*g3,     0,        0, -L**2*g5, -L*g3,     0,        0,  L**2*g6],
-                    [   0,  L*g3,  L**2*g5,        0,     0, -L*g3, -L**2*g6,        0],
-            ])
-            # fmt: on
-            G = self.material.rho * Ie_l * 2 * G / (210 * L * (1 + phi) ** 2)
 
         else:
             G = np.zeros((8, 8))
@@ -1639,71 +1376,20 @@ class ShaftElement6DoF(ShaftElement):
 
         # element level matrix declaration
         aux1 = self.material.rho * tempS * L / 420
+        M_t = _mass_template_6dof(L)
         # fmt: off
 
         # Standard mass matrix
-        M = aux1 * np.array([
-            [  156,     0, 0,      0,  -22*L, 0,    54,     0, 0,      0,   13*L, 0],
-            [    0,   156, 0,   22*L,      0, 0,     0,    54, 0,  -13*L,      0, 0],
-            [    0,     0, 0,      0,      0, 0,     0,     0, 0,      0,      0, 0],
-            [    0,  22*L, 0, 4*L**2,      0, 0,     0,  13*L, 0,-3*L**2,      0, 0],
-            [-22*L,     0, 0,      0, 4*L**2, 0, -13*L,     0, 0,      0,-3*L**2, 0],
-            [    0,     0, 0,      0,      0, 0,     0,     0, 0,      0,      0, 0],
-            [   54,     0, 0,      0,  -13*L, 0,   156,     0, 0,      0,   22*L, 0],
-            [    0,    54, 0,   13*L,      0, 0,     0,   156, 0,  -22*L,      0, 0],
-            [    0,     0, 0,      0,      0, 0,     0,     0, 0,      0,      0, 0],
-            [    0, -13*L, 0,-3*L**2,      0, 0,     0, -22*L, 0, 4*L**2,      0, 0],
-            [ 13*L,     0, 0,      0,-3*L**2, 0,  22*L,     0, 0,      0, 4*L**2, 0],
-            [    0,     0, 0,      0,      0, 0,     0,     0, 0,      0,      0, 0],
-        ])
+        M = aux1 * M_t
 
         # Secondary inertias mass matrix
-        Ms = self.material.rho * tempI / (30 * L) * np.array([
-            [  36,   0, 0,     0,  -3*L, 0, -36,    0, 0,     0,  -3*L, 0],
-            [   0,  36, 0,   3*L,     0, 0,   0,  -36, 0,   3*L,     0, 0],
-            [   0,   0, 0,     0,     0, 0,   0,    0, 0,     0,     0, 0],
-            [   0, 3*L, 0,4*L**2,     0, 0,   0, -3*L, 0, -L**2,     0, 0],
-            [-3*L,   0, 0,     0,4*L**2, 0, 3*L,    0, 0,     0, -L**2, 0],
-            [   0,   0, 0,     0,     0, 0,   0,    0, 0,     0,     0, 0],
-            [ -36,   0, 0,     0,   3*L, 0,  36,    0, 0,     0,   3*L, 0],
-            [   0, -36, 0,  -3*L,     0, 0,   0,   36, 0,  -3*L,     0, 0],
-            [   0,   0, 0,     0,     0, 0,   0,    0, 0,     0,     0, 0],
-            [   0, 3*L, 0, -L**2,     0, 0,   0, -3*L, 0,4*L**2,     0, 0],
-            [-3*L,   0, 0,     0, -L**2, 0, 3*L,    0, 0,     0,4*L**2, 0],
-            [   0,   0, 0,     0,     0, 0,   0,    0, 0,     0,     0, 0],
-        ])
+        Ms = self.material.rho * tempI / (30 * L) * _secondary_template_6dof(L)
 
         # Axial terms inertia matrix
-        Ma = self.material.rho * tempS * L / 6 * np.array([
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 2, 0, 0, 0, 0, 0, 1, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 1, 0, 0, 0, 0, 0, 2, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        ])
+        Ma = self.material.rho * tempS * L / 6 * _AXIAL_MASS_6DOF
 
         # Torsional terms inertias matrix
-        Mr = self.material.rho * tempI * L / 6 * np.array([
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 1],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 2],
-        ])
+        Mr = self.material.rho * tempI * L / 6 * _TORSIONAL_MASS_6DOF
 
         # fmt: on
 
@@ -1786,36 +1472,11 @@ class ShaftElement6DoF(ShaftElement):
         ])
 
         # stiffness matrix due to axial loading influence
-        Kf = Fa / (30 * L) * np.array([
-            [  36,   0, 0,     0,  -3*L, 0, -36,    0, 0,     0,  -3*L, 0],
-            [   0,  36, 0,   3*L,     0, 0,   0,  -36, 0,   3*L,     0, 0],
-            [   0,   0, 0,     0,     0, 0,   0,    0, 0,     0,     0, 0],
-            [   0, 3*L, 0,4*L**2,     0, 0,   0, -3*L, 0, -L**2,     0, 0],
-            [-3*L,   0, 0,     0,4*L**2, 0, 3*L,    0, 0,     0, -L**2, 0],
-            [   0,   0, 0,     0,     0, 0,   0,    0, 0,     0,     0, 0],
-            [ -36,   0, 0,     0,   3*L, 0,  36,    0, 0,     0,   3*L, 0],
-            [   0, -36, 0,  -3*L,     0, 0,   0,   36, 0,  -3*L,     0, 0],
-            [   0,   0, 0,     0,     0, 0,   0,    0, 0,     0,     0, 0],
-            [   0, 3*L, 0, -L**2,     0, 0,   0, -3*L, 0,4*L**2,     0, 0],
-            [-3*L,   0, 0,     0, -L**2, 0, 3*L,    0, 0,     0,4*L**2, 0],
-            [   0,   0, 0,     0,     0, 0,   0,    0, 0,     0,     0, 0],
-        ])
+        Kf_t, Kt_t = _load_templates_6dof(L)
+        Kf = Fa / (30 * L) * Kf_t
 
         # stiffness matrix due to torque loading influence
-        Kt = T * np.array([
-            [   0,    0, 0, -1/L,    0, 0,    0,    0, 0,  1/L,    0, 0],
-            [   0,    0, 0,    0, -1/L, 0,    0,    0, 0,    0,  1/L, 0],
-            [   0,    0, 0,    0,    0, 0,    0,    0, 0,    0,    0, 0],
-            [-1/L,    0, 0,    0,  1/2, 0,  1/L,    0, 0,    0,  1/2, 0],
-            [   0, -1/L, 0, -1/2,    0, 0,    0,  1/L, 0, -1/2,    0, 0],
-            [   0,    0, 0,    0,    0, 0,    0,    0, 0,    0,    0, 0],
-            [   0,    0, 0,  1/L,    0, 0,    0,    0, 0, -1/L,    0, 0],
-            [   0,    0, 0,    0,  1/L, 0,    0,    0, 0,    0, -1/L, 0],
-            [   0,    0, 0,    0,    0, 0,    0,    0, 0,    0,    0, 0],
-            [ 1/L,    0, 0,    0, -1/2, 0, -1/L,    0, 0,    0, -1/2, 0],
-            [   0,  1/L, 0,  1/2,    0, 0,    0, -1/L, 0,  1/2,    0, 0],
-            [   0,    0, 0,    0,    0, 0,    0,    0, 0,    0,    0, 0],
-        ])
+        Kt = T * Kt_t
         # fmt: on
         # Dynamic stiffness matrix is added independently in "def Kst"
         # Kst = self.material.rho*tempI/(15*L)*np.array(12,12)
@@ -1863,20 +1524,8 @@ class ShaftElement6DoF(ShaftElement):
 
         # fmt: off
         # dynamic stiffening matrix
-        Kst = self.material.rho * tempI / (15 * L) * np.array([
-            [0, -36, 0,   -3*L, 0, 0, 0,   36, 0,   -3*L, 0, 0],
-            [0,   0, 0,      0, 0, 0, 0,    0, 0,      0, 0, 0],
-            [0,   0, 0,      0, 0, 0, 0,    0, 0,      0, 0, 0],
-            [0,   0, 0,      0, 0, 0, 0,    0, 0,      0, 0, 0],
-            [0, 3*L, 0, 4*L**2, 0, 0, 0, -3*L, 0,  -L**2, 0, 0],
-            [0,   0, 0,      0, 0, 0, 0,    0, 0,      0, 0, 0],
-            [0,  36, 0,    3*L, 0, 0, 0,  -36, 0,    3*L, 0, 0],
-            [0,   0, 0,      0, 0, 0, 0,    0, 0,      0, 0, 0],
-            [0,   0, 0,      0, 0, 0, 0,    0, 0,      0, 0, 0],
-            [0,   0, 0,      0, 0, 0, 0,    0, 0,      0, 0, 0],
-            [0, 3*L, 0,  -L**2, 0, 0, 0, -3*L, 0, 4*L**2, 0, 0],
-            [0,   0, 0,      0, 0, 0, 0,    0, 0,      0, 0, 0],
-        ])
+        Kst_t = _dynamic_stiffness_template_6dof(L)
+        Kst = self.material.rho * tempI / (15 * L) * Kst_t
         # fmt: on
 
         return Kst
@@ -2144,3 +1793,489 @@ class ShaftElement6DoF(ShaftElement):
         ]
 
         return elements
+
+
+# The element matrices below depend only on the geometry of the element and on
+# its shear factor phi, and are scaled by the material properties and loads of
+# each element. They are memoized, since the same element geometry is
+# assembled repeatedly (e.g. for each speed of a Campbell diagram or for each
+# sample of a stochastic rotor). The returned arrays are read-only.
+
+
+@lru_cache(maxsize=1024)
+def _mass_template(L, phi, a1, a2, b1, b2, gama, delta, A_l, Ie_l, rotary_inertia):
+    """Mass matrix of a shaft element per unit of density.
+
+    Returns
+    -------
+    M : np.ndarray
+        Mass matrix divided by the material density.
+    """
+    m1 = (
+        (468 + 882 * phi + 420 * phi**2)
+        + a1 * (108 + 210 * phi + 105 * phi**2)
+        + b1 * (38 + 78 * phi + 42 * phi**2)
+    )
+    m2 = (
+        (66 + 115.5 * phi + 52.5 * phi**2)
+        + a1 * (21 + 40.5 * phi + 21 * phi**2)
+        + b1 * (8.5 + 18 * phi + 10.5 * phi**2)
+    )
+    m3 = (
+        (162 + 378 * phi + 210 * phi**2)
+        + a1 * (81 + 189 * phi + 105 * phi**2)
+        + b1 * (46 + 111 * phi + 63 * phi**2)
+    )
+    m4 = (
+        (39 + 94.5 * phi + 52.5 * phi**2)
+        + a1 * (18 + 40.5 * phi + 21 * phi**2)
+        + b1 * (9.5 + 21 * phi + 10.5 * phi**2)
+    )
+    m5 = (
+        (12 + 21 * phi + 10.5 * phi**2)
+        + a1 * (4.5 + 9 * phi + 5.25 * phi**2)
+        + b1 * (2 + 4.5 * phi + 3 * phi**2)
+    )
+    m6 = (
+        (39 + 94.5 * phi + 52.5 * phi**2)
+        + a1 * (21 + 54 * phi + 31.5 * phi**2)
+        + b1 * (12.5 + 34.5 * phi + 21 * phi**2)
+    )
+    m7 = (
+        (9 + 21 * phi + 10.5 * phi**2)
+        + a1 * (4.5 + 10.5 * phi + 5.25 * phi**2)
+        + b1 * (2.5 + 6 * phi + 3 * phi**2)
+    )
+    m8 = (
+        (468 + 882 * phi + 420 * phi**2)
+        + a1 * (360 + 672 * phi + 315 * phi**2)
+        + b1 * (290 + 540 * phi + 252 * phi**2)
+    )
+    m9 = (
+        (66 + 115.5 * phi + 52.5 * phi**2)
+        + a1 * (45 + 75 * phi + 31.5 * phi**2)
+        + b1 * (32.5 + 52.5 * phi + 21 * phi**2)
+    )
+    m10 = (
+        (12 + 21 * phi + 10.5 * phi**2)
+        + a1 * (7.5 + 12 * phi + 5.25 * phi**2)
+        + b1 * (5 + 7.5 * phi + 3 * phi**2)
+    )
+
+    # fmt: off
+    Mt = np.array([
+            [   m1,     0,        0,    L*m2,     m3,     0,        0,    -L*m4],
+            [    0,    m1,    -L*m2,       0,      0,    m3,     L*m4,        0],
+            [    0, -L*m2,  L**2*m5,       0,      0, -L*m6, -L**2*m7,        0],
+            [ L*m2,     0,        0,  L**2*m5,  L*m6,     0,        0, -L**2*m7],
+            [   m3,     0,        0,     L*m6,    m8,     0,        0,    -L*m9],
+            [    0,    m3,    -L*m6,        0,     0,    m8,     L*m9,        0],
+            [    0,  L*m4, -L**2*m7,        0,     0,  L*m9, L**2*m10,        0],
+            [-L*m4,     0,        0, -L**2*m7, -L*m9,     0,        0, L**2*m10],
+    ])
+    # fmt: on
+    M = A_l * L * Mt / (1260 * (1 + phi) ** 2)
+
+    if rotary_inertia:
+        # fmt: off
+        m11 = 252 + 126 * a2 + 72 * b2 + 45 * gama + 30 * delta
+        m12 = (
+            21 - 105 * phi
+            + a2 * (21 - 42 * phi)
+            + b2 * (15 - 21 * phi)
+            + gama * (10.5 - 12 * phi)
+            + delta * (7.5 - 7.5 * phi)
+        )
+        m13 = (
+            21 - 105 * phi
+            - 63 * a2 * phi
+            - b2 * (6 + 42 * phi)
+            - gama * (7.5 + 30 * phi)
+            - delta * (7.5 + 22.5 * phi)
+        )
+        m14 = (
+            28 + 35 * phi + 70 * phi ** 2
+            + a2 * (7 - 7 * phi + 17.5 * phi ** 2)
+            + b2 * (4 - 7 * phi + 7 * phi ** 2)
+            + gama * (2.75 - 5 * phi + 3.5 * phi ** 2)
+            + delta * (2 - 3.5 * phi + 2 * phi ** 2)
+        )
+        m15 = (
+            7 + 35 * phi - 35 * phi ** 2
+            + a2 * (3.5 + 17.5 * phi - 17.5 * phi ** 2)
+            + b2 * (3 + 10.5 * phi - 10.5 * phi ** 2)
+            + gama * (2.75 + 7 * phi - 7 * phi ** 2)
+            + delta * (2.5 + 5 * phi - 5 * phi ** 2)
+        )
+        m16 = (
+            28 + 35 * phi + 70 * phi ** 2
+            + a2 * (21 + 42 * phi + 52.5 * phi ** 2)
+            + b2 * (18 + 42 * phi + 42 * phi ** 2)
+            + gama * (16.25 + 40 * phi + 35 * phi ** 2)
+            + delta * (15 + 37.5 * phi + 30 * phi ** 2)
+        )
+
+        Mr = np.array([
+                [  m11,      0,         0,     L*m12,   -m11,     0,         0,     L*m13],
+                [    0,    m11,    -L*m12,         0,      0,  -m11,    -L*m13,         0],
+                [    0, -L*m12,  L**2*m14,         0,      0, L*m12, -L**2*m15,         0],
+                [L*m12,      0,         0,  L**2*m14, -L*m12,     0,         0, -L**2*m15],
+                [ -m11,      0,         0,    -L*m12,    m11,     0,         0,    -L*m13],
+                [    0,   -m11,     L*m12,         0,      0,   m11,     L*m13,         0],
+                [    0, -L*m13, -L**2*m15,         0,      0, L*m13,  L**2*m16,         0],
+                [L*m13,      0,         0, -L**2*m15, -L*m13,     0,         0,  L**2*m16],
+        ])
+        # fmt: on
+        Mr = Ie_l * Mr / (210 * L * (1 + phi) ** 2)
+        M = M + Mr
+
+    M.setflags(write=False)
+
+    return M
+
+
+@lru_cache(maxsize=1024)
+def _stiffness_templates(L, phi, a1, a2, b1, b2, gama, delta, A, A_l, Ie, Ie_l):
+    """Stiffness matrices of a shaft element per unit of each scaling factor.
+
+    Returns
+    -------
+    K : np.ndarray
+        Stiffness matrix divided by the Young's modulus.
+    Kaxial : np.ndarray
+        Stiffness matrix due to the axial force, divided by the axial force.
+    Ktorque : np.ndarray
+        Stiffness matrix due to the torque, divided by the torque.
+    """
+    # fmt: off
+    k1 = 1260 + 630 * a2 + 504 * b2 + 441 * gama + 396 * delta
+    k2 = (
+        630
+        + 210 * a2
+        + 147 * b2
+        + 126 * gama
+        + 114 * delta
+        - phi * (105 * a2 + 105 * b2 + 94.5 * gama + 84 * delta)
+    )
+    k3 = (
+        630
+        + 420 * a2
+        + 357 * b2
+        + 315 * gama
+        + 282 * delta
+        + phi * (105 * a2 + 105 * b2 + 94.5 * gama + 84 * delta)
+    )
+    k4 = (
+        420 + 210 * phi + 105 * phi ** 2
+        + a2 * (105 + 52.5 * phi ** 2)
+        + b2 * (56 - 35 * phi + 35 * phi ** 2)
+        + gama * (42 - 42 * phi + 26.25 * phi ** 2)
+        + delta * (36 - 42 * phi + 21 * phi ** 2)
+    )
+    k5 = (
+        210 - 210 * phi - 105 * phi ** 2
+        + a2 * (105 - 105 * phi - 52.5 * phi ** 2)
+        + b2 * (91 - 70 * phi - 35 * phi ** 2)
+        + gama * (84 - 52.5 * phi - 26.25 * phi ** 2)
+        + delta * (78 - 42 * phi - 21 * phi ** 2)
+    )
+    k6 = (
+        420 + 210 * phi + 105 * phi ** 2
+        + a2 * (315 + 210 * phi + 52.5 * phi ** 2)
+        + b2 * (266 + 175 * phi + 35 * phi ** 2)
+        + gama * (231 + 147 * phi + 26.25 * phi ** 2)
+        + delta * (204 + 126 * phi + 21 * phi ** 2)
+    )
+    k7 = 12 + 6 * a1 + 4 * b1
+    k8 = 6 + 3 * a1 + 2 * b1
+    k9 = 3 + 1.5 * a1 + b1
+
+    K1 = np.array([
+        [  k1,     0,       0,    L*k2,   -k1,    0,       0,    L*k3],
+        [   0,    k1,   -L*k2,       0,     0,  -k1,   -L*k3,       0],
+        [   0, -L*k2, L**2*k4,       0,     0, L*k2, L**2*k5,       0],
+        [L*k2,     0,       0, L**2*k4, -L*k2,    0,       0, L**2*k5],
+        [ -k1,     0,       0,   -L*k2,    k1,    0,       0,   -L*k3],
+        [   0,   -k1,    L*k2,       0,     0,   k1,    L*k3,       0],
+        [   0, -L*k3, L**2*k5,       0,     0, L*k3, L**2*k6,       0],
+        [L*k3,     0,       0, L**2*k5, -L*k3,    0,       0, L**2*k6],
+    ])
+
+    K2 = np.array([
+        [  k7,     0,       0,    L*k8,   -k7,     0,       0,    L*k8],
+        [   0,    k7,   -L*k8,       0,     0,   -k7,   -L*k8,       0],
+        [   0, -L*k8, L**2*k9,       0,     0,  L*k8, L**2*k9,       0],
+        [L*k8,     0,       0, L**2*k9, -L*k8,     0,       0, L**2*k9],
+        [ -k7,     0,       0,   -L*k8,    k7,     0,       0,   -L*k8],
+        [   0,   -k7,    L*k8,       0,     0,    k7,    L*k8,       0],
+        [   0, -L*k8, L**2*k9,       0,     0,  L*k8, L**2*k9,       0],
+        [L*k8,     0,       0, L**2*k9, -L*k8,     0,       0, L**2*k9],
+    ])
+
+    K = L**(-3) * (1 + phi)**(-2) * (K1 * Ie_l/105 + K2 * Ie * phi * A_l / A)
+
+    # axial force
+    k10 = 36 + 60 * phi + 30 * phi ** 2
+    k11 = L * 3
+    k12 = L ** 2 * (4 + 5 * phi + 2.5 * phi ** 2)
+    k13 = L ** 2 * (1 + 5 * phi + 2.5 * phi ** 2)
+
+    Kaxial = np.array([
+        [ k10,    0,    0,  k11, -k10,    0,    0,  k11],
+        [   0,  k10, -k11,    0,    0, -k10, -k11,    0],
+        [   0, -k11,  k12,    0,    0,  k11, -k13,    0],
+        [ k11,    0,    0,  k12, -k11,    0,    0, -k13],
+        [-k10,    0,    0, -k11,  k10,    0,    0, -k11],
+        [   0, -k10,  k11,    0,    0,  k10,  k11,    0],
+        [   0, -k11, -k13,    0,    0,  k11,  k12,    0],
+        [ k11,    0,    0, -k13, -k11,    0,    0,  k12],
+    ])
+
+    Kaxial /= 30 * L * (1 + phi) ** 2
+
+    # torque
+    Ktorque = np.array([
+        [   0,    0,    1,    0,    0,    0,   -1,    0],
+        [   0,    0,    0,    1,    0,    0,    0,   -1],
+        [   1,    0,    0, -L/2,   -1,    0,    0,  L/2],
+        [   0,    1,  L/2,    0,    0,   -1, -L/2,    0],
+        [   0,    0,   -1,    0,    0,    0,    1,    0],
+        [   0,    0,    0,   -1,    0,    0,    0,    1],
+        [  -1,    0,    0, -L/2,    1,    0,    0,  L/2],
+        [   0,   -1,  L/2,    0,    0,    1, -L/2,    0],
+    ])
+
+    Ktorque = Ktorque / L
+    # fmt: on
+
+    for matrix in (K, Kaxial, Ktorque):
+        matrix.setflags(write=False)
+
+    return K, Kaxial, Ktorque
+
+
+@lru_cache(maxsize=1024)
+def _gyroscopic_template(L, phi, a2, b2, gama, delta, Ie_l):
+    """Gyroscopic matrix of a shaft element per unit of density.
+
+    Returns
+    -------
+    G : np.ndarray
+        Gyroscopic matrix divided by the material density.
+    """
+    # fmt: off
+    g1 = 252 + 126 * a2 + 72 * b2 + 45 * gama + 30 * delta
+    g2 = (
+        21 - 105 * phi
+        + a2 * (21 - 42 * phi)
+        + b2 * (15 - 21 * phi)
+        + gama * (10.5 - 12 * phi)
+        + delta * (7.5 - 7.5 * phi)
+    )
+    g3 = (
+        21 - 105 * phi
+        - 63 * a2 * phi
+        - b2 * (6 + 42 * phi)
+        - gama * (7.5 + 30 * phi)
+        - delta * (7.5 + 22.5 * phi)
+    )
+    g4 = (
+        28 + 35 * phi + 70 * phi ** 2
+        + a2 * (7 - 7 * phi + 17.5 * phi ** 2)
+        + b2 * (4 - 7 * phi + 7 * phi ** 2)
+        + gama * (2.75 - 5 * phi + 3.5 * phi ** 2)
+        + delta * (2 - 3.5 * phi + 2 * phi ** 2)
+    )
+    g5 = (
+        7 + 35 * phi - 35 * phi ** 2
+        + a2 * (3.5 + 17.5 * phi - 17.5 * phi ** 2)
+        + b2 * (3 + 10.5 * phi - 10.5 * phi ** 2)
+        + gama * (2.75 + 7 * phi - 7 * phi ** 2)
+        + delta * (2.5 + 5 * phi - 5 * phi ** 2)
+    )
+    g6 = (
+        28 + 35 * phi + 70 * phi ** 2
+        + a2 * (21 + 42 * phi + 52.5 * phi ** 2)
+        + b2 * (18 + 42 * phi + 42 * phi ** 2)
+        + gama * (16.25 + 40 * phi + 35 * phi ** 2)
+        + delta * (15 + 37.5 * phi + 30 * phi ** 2)
+    )
+
+    G = np.array([
+            [   0,    g1,    -L*g2,        0,     0,   -g1,    -L*g3,        0],
+            [ -g1,     0,        0,    -L*g2,    g1,     0,        0,    -L*g3],
+            [L*g2,     0,        0,  L**2*g4, -L*g2,     0,        0, -L**2*g5],
+            [   0,  L*g2, -L**2*g4,        0,     0, -L*g2,  L**2*g5,        0],
+            [   0,   -g1,     L*g2,        0,     0,    g1,     L*g3,        0],
+            [  g1,     0,        0,     L*g2,   -g1,     0,        0,     L*g3],
+            [L*g3,     0,        0, -L**2*g5, -L*g3,     0,        0,  L**2*g6],
+            [   0,  L*g3,  L**2*g5,        0,     0, -L*g3, -L**2*g6,        0],
+    ])
+    # fmt: on
+    G = Ie_l * 2 * G / (210 * L * (1 + phi) ** 2)
+    G.setflags(write=False)
+
+    return G
+
+
+# The 6 DoF element matrices are built from coefficient tables that depend at
+# most on the element length, so they are shared by all elements with the same L.
+
+# fmt: off
+_AXIAL_MASS_6DOF = np.array([
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 2, 0, 0, 0, 0, 0, 1, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 1, 0, 0, 0, 0, 0, 2, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+])
+
+_TORSIONAL_MASS_6DOF = np.array([
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 2, 0, 0, 0, 0, 0, 1],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 2],
+])
+# fmt: on
+_AXIAL_MASS_6DOF.setflags(write=False)
+_TORSIONAL_MASS_6DOF.setflags(write=False)
+
+
+@lru_cache(maxsize=1024)
+def _secondary_template_6dof(L):
+    """Coefficient table of the secondary inertias and axial force matrices.
+
+    The secondary inertias mass matrix and the axial force stiffness matrix of
+    a 6 DoF shaft element share the same table, scaled by rho * I / (30 * L) and
+    by Fa / (30 * L) respectively.
+
+    Returns
+    -------
+    S : np.ndarray
+        Shared coefficient table.
+    """
+    # fmt: off
+    S = np.array([
+        [  36,   0, 0,     0,  -3*L, 0, -36,    0, 0,     0,  -3*L, 0],
+        [   0,  36, 0,   3*L,     0, 0,   0,  -36, 0,   3*L,     0, 0],
+        [   0,   0, 0,     0,     0, 0,   0,    0, 0,     0,     0, 0],
+        [   0, 3*L, 0,4*L**2,     0, 0,   0, -3*L, 0, -L**2,     0, 0],
+        [-3*L,   0, 0,     0,4*L**2, 0, 3*L,    0, 0,     0, -L**2, 0],
+        [   0,   0, 0,     0,     0, 0,   0,    0, 0,     0,     0, 0],
+        [ -36,   0, 0,     0,   3*L, 0,  36,    0, 0,     0,   3*L, 0],
+        [   0, -36, 0,  -3*L,     0, 0,   0,   36, 0,  -3*L,     0, 0],
+        [   0,   0, 0,     0,     0, 0,   0,    0, 0,     0,     0, 0],
+        [   0, 3*L, 0, -L**2,     0, 0,   0, -3*L, 0,4*L**2,     0, 0],
+        [-3*L,   0, 0,     0, -L**2, 0, 3*L,    0, 0,     0,4*L**2, 0],
+        [   0,   0, 0,     0,     0, 0,   0,    0, 0,     0,     0, 0],
+    ])
+    # fmt: on
+    S.setflags(write=False)
+
+    return S
+
+
+@lru_cache(maxsize=1024)
+def _mass_template_6dof(L):
+    """Standard mass matrix of a 6 DoF shaft element, without its scale factor.
+
+    Returns
+    -------
+    M : np.ndarray
+        Standard mass matrix divided by rho * A * L / 420.
+    """
+    # fmt: off
+    M = np.array([
+        [  156,     0, 0,      0,  -22*L, 0,    54,     0, 0,      0,   13*L, 0],
+        [    0,   156, 0,   22*L,      0, 0,     0,    54, 0,  -13*L,      0, 0],
+        [    0,     0, 0,      0,      0, 0,     0,     0, 0,      0,      0, 0],
+        [    0,  22*L, 0, 4*L**2,      0, 0,     0,  13*L, 0,-3*L**2,      0, 0],
+        [-22*L,     0, 0,      0, 4*L**2, 0, -13*L,     0, 0,      0,-3*L**2, 0],
+        [    0,     0, 0,      0,      0, 0,     0,     0, 0,      0,      0, 0],
+        [   54,     0, 0,      0,  -13*L, 0,   156,     0, 0,      0,   22*L, 0],
+        [    0,    54, 0,   13*L,      0, 0,     0,   156, 0,  -22*L,      0, 0],
+        [    0,     0, 0,      0,      0, 0,     0,     0, 0,      0,      0, 0],
+        [    0, -13*L, 0,-3*L**2,      0, 0,     0, -22*L, 0, 4*L**2,      0, 0],
+        [ 13*L,     0, 0,      0,-3*L**2, 0,  22*L,     0, 0,      0, 4*L**2, 0],
+        [    0,     0, 0,      0,      0, 0,     0,     0, 0,      0,      0, 0],
+    ])
+    # fmt: on
+    M.setflags(write=False)
+
+    return M
+
+
+@lru_cache(maxsize=1024)
+def _load_templates_6dof(L):
+    """Axial force and torque stiffness matrices of a 6 DoF shaft element.
+
+    Returns
+    -------
+    Kf, Kt : np.ndarray
+        Axial force stiffness matrix divided by Fa / (30 * L) and stiffness
+        matrix per unit of torque.
+    """
+    # fmt: off
+    Kt = np.array([
+        [   0,    0, 0, -1/L,    0, 0,    0,    0, 0,  1/L,    0, 0],
+        [   0,    0, 0,    0, -1/L, 0,    0,    0, 0,    0,  1/L, 0],
+        [   0,    0, 0,    0,    0, 0,    0,    0, 0,    0,    0, 0],
+        [-1/L,    0, 0,    0,  1/2, 0,  1/L,    0, 0,    0,  1/2, 0],
+        [   0, -1/L, 0, -1/2,    0, 0,    0,  1/L, 0, -1/2,    0, 0],
+        [   0,    0, 0,    0,    0, 0,    0,    0, 0,    0,    0, 0],
+        [   0,    0, 0,  1/L,    0, 0,    0,    0, 0, -1/L,    0, 0],
+        [   0,    0, 0,    0,  1/L, 0,    0,    0, 0,    0, -1/L, 0],
+        [   0,    0, 0,    0,    0, 0,    0,    0, 0,    0,    0, 0],
+        [ 1/L,    0, 0,    0, -1/2, 0, -1/L,    0, 0,    0, -1/2, 0],
+        [   0,  1/L, 0,  1/2,    0, 0,    0, -1/L, 0,  1/2,    0, 0],
+        [   0,    0, 0,    0,    0, 0,    0,    0, 0,    0,    0, 0],
+    ])
+    # fmt: on
+    Kt.setflags(write=False)
+
+    return _secondary_template_6dof(L), Kt
+
+
+@lru_cache(maxsize=1024)
+def _dynamic_stiffness_template_6dof(L):
+    """Dynamic stiffness matrix of a 6 DoF shaft element, without its scale factor.
+
+    Returns
+    -------
+    Kst : np.ndarray
+        Dynamic stiffness matrix divided by rho * I / (15 * L).
+    """
+    # fmt: off
+    Kst = np.array([
+        [0, -36, 0,   -3*L, 0, 0, 0,   36, 0,   -3*L, 0, 0],
+        [0,   0, 0,      0, 0, 0, 0,    0, 0,      0, 0, 0],
+        [0,   0, 0,      0, 0, 0, 0,    0, 0,      0, 0, 0],
+        [0,   0, 0,      0, 0, 0, 0,    0, 0,      0, 0, 0],
+        [0, 3*L, 0, 4*L**2, 0, 0, 0, -3*L, 0,  -L**2, 0, 0],
+        [0,   0, 0,      0, 0, 0, 0,    0, 0,      0, 0, 0],
+        [0,  36, 0,    3*L, 0, 0, 0,  -36, 0,    3*L, 0, 0],
+        [0,   0, 0,      0, 0, 0, 0,    0, 0,      0, 0, 0],
+        [0,   0, 0,      0, 0, 0, 0,    0, 0,      0, 0, 0],
+        [0,   0, 0,      0, 0, 0, 0,    0, 0,      0, 0, 0],
+        [0, 3*L, 0,  -L**2, 0, 0, 0, -3*L, 0, 4*L**2, 0, 0],
+        [0,   0, 0,      0, 0, 0, 0,    0, 0,      0, 0, 0],
+    ])
+    # fmt: on
+    Kst.setflags(write=False)
+
+    return Kst
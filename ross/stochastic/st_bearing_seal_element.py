@@ -128,6 +128,9 @@ class ST_BearingElement:
         is_random=None,
     ):
 
+        # copy, so the caller's list is not extended with kyy/cyy
+        is_random = list(is_random) if is_random is not None else []
+
         if "frequency" in is_random:
             raise ValueError("frequency can not be a random variable")
 
@@ -105,53 +105,69 @@ class ST_Rotor(object):
         if point_mass_elements is None:
             point_mass_elements = []
 
-        # checking for random elements and matching sizes
+        # generating the random elements once and checking for matching sizes
         is_random = []
         len_list = []
 
-        if any(isinstance(elm, ST_ShaftElement) for elm in shaft_elements):
+        random_sh = [
+            i
+            for i, elm in enumerate(shaft_elements)
+            if isinstance(elm, ST_ShaftElement)
+        ]
+        if random_sh:
             is_random.append("shaft_elements")
 
-            it = iter(
-                [elm for elm in shaft_elements if isinstance(elm, ST_ShaftElement)]
-            )
-            len_sh = len(list(next(iter(it))))
-            if not all(len(list(l)) == len_sh for l in it):
+            for i in random_sh:
+                shaft_elements[i] = list(iter(shaft_elements[i]))
+            len_sh = len(shaft_elements[random_sh[0]])
+            if not all(len(shaft_elements[i]) == len_sh for i in random_sh):
                 raise ValueError(
                     "not all random shaft elements lists have same length."
                 )
             len_list.append(len_sh)
 
-        if any(isinstance(elm, ST_DiskElement) for elm in disk_elements):
+        random_dk = [
+            i for i, elm in enumerate(disk_elements) if isinstance(elm, ST_DiskElement)
+        ]
+        if random_dk:
             is_random.append("disk_elements")
 
-            it = iter([elm for elm in disk_elements if isinstance(elm, ST_DiskElement)])
-            len_dk = len(list(next(iter(it))))
-            if not all(len(list(l)) == len_dk for l in it):
+            for i in random_dk:
+                disk_elements[i] = list(iter(disk_elements[i]))
+            len_dk = len(disk_elements[random_dk[0]])
+            if not all(len(disk_elements[i]) == len_dk for i in random_dk):
                 raise ValueError("not all random disk elements lists have same length.")
             len_list.append(len_dk)
 
-        if any(isinstance(elm, ST_BearingElement) for elm in bearing_elements):
+        random_brg = [
+            i
+            for i, elm in enumerate(bearing_elements)
+            if isinstance(elm, ST_BearingElement)
+        ]
+        if random_brg:
             is_random.append("bearing_elements")
 
-            it = iter(
-                [elm for elm in bearing_elements if isinstance(elm, ST_BearingElement)]
-            )
-            len_brg = len(list(next(iter(it))))
-            if not all(len(list(l)) == len_brg for l in it):
+            for i in random_brg:
+                bearing_elements[i] = list(iter(bearing_elements[i]))
+            len_brg = len(bearing_elements[random_brg[0]])
+            if not all(len(bearing_elements[i]) == len_brg for i in random_brg):
                 raise ValueError(
                     "not all random bearing elements lists have same length."
                 )
             len_list.append(len_brg)
 
-        if any(isinstance(elm, ST_PointMass) for elm in point_mass_elements):
+        random_pm = [
+            i
+            for i, elm in enumerate(point_mass_elements)
+            if isinstance(elm, ST_PointMass)
+        ]
+        if random_pm:
             is_random.append("point_mass_elements")
 
-            it = iter(
-                [elm for elm in point_mass_elements if isinstance(elm, ST_PointMass)]
-            )
-            len_pm = len(list(next(iter(it))))
-            if not all(len(list(l)) == len_pm for l in it):
+            for i in random_pm:
+                point_mass_elements[i] = list(iter(point_mass_elements[i]))
+            len_pm = len(point_mass_elements[random_pm[0]])
+            if not all(len(point_mass_elements[i]) == len_pm for i in random_pm):
                 raise ValueError("not all random point mass lists have same length.")
             len_list.append(len_pm)
 
@@ -160,22 +176,6 @@ class ST_Rotor(object):
         else:
             raise ValueError("not all the random elements lists have the same length.")
 
-        for i, elm in enumerate(shaft_elements):
-            if isinstance(elm, ST_ShaftElement):
-                shaft_elements[i] = list(iter(elm))
-
-        for i, elm in enumerate(disk_elements):
-            if isinstance(elm, ST_DiskElement):
-                disk_elements[i] = list(iter(elm))
-
-        for i, elm in enumerate(bearing_elements):
-            if isinstance(elm, ST_BearingElement):
-                bearing_elements[i] = list(iter(elm))
-
-        for i, elm in enumerate(point_mass_elements):
-            if isinstance(elm, ST_PointMass):
-                point_mass_elements[i] = list(iter(elm))
-
         attribute_dict = dict(
             shaft_elements=shaft_elements,
             disk_elements=disk_elements,
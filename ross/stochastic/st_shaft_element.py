@@ -3,8 +3,9 @@
 This module creates an instance of random shaft element for stochastic
 analysis.
 """
+from concurrent.futures import ProcessPoolExecutor
+
 from ross.shaft_element import ShaftElement
-from ross.stochastic.st_materials import ST_Material
 from ross.stochastic.st_results_elements import plot_histogram
 from ross.units import Q_, check_units
 
@@ -36,9 +37,10 @@ class ST_ShaftElement:
         Outer diameter of the element at the right position.
         Default is equal to odl value (cylindrical element)
         Input a list to make it random.
-    material : ross.material, list of ross.material
+    material : ross.material, list of ross.material, ST_Material
         Shaft material.
-        Input a list to make it random.
+        Input a list or a ST_Material to make it random. The materials of a
+        ST_Material are only created as the elements are generated.
     n : int, optional
         Element number (coincident with it's first node).
         If not given, it will be set when the rotor is assembled
@@ -73,11 +75,12 @@ class ST_ShaftElement:
     >>> import numpy as np
     >>> import ross.stochastic as srs
     >>> size = 5
-    >>> E = np.random.uniform(208e9, 211e9, size)
+    >>> rng = np.random.default_rng()
+    >>> E = rng.uniform(208e9, 211e9, size)
     >>> st_steel = srs.ST_Material(name="Steel", rho=7810, E=E, G_s=81.2e9)
     >>> elms = srs.ST_ShaftElement(L=1,
     ...                            idl=0,
-    ...                            odl=np.random.uniform(0.1, 0.2, size),
+    ...                            odl=rng.uniform(0.1, 0.2, size),
     ...                            material=st_steel,
     ...                            is_random=["odl", "material"],
     ...                            )
@@ -104,6 +107,9 @@ class ST_ShaftElement:
         is_random=None,
     ):
 
+        # copy, so the caller's list is not extended with idr/odr
+        is_random = list(is_random) if is_random is not None else []
+
         if idr is None:
             idr = idl
             if "idl" in is_random and "idr" not in is_random:
@@ -112,9 +118,6 @@ class ST_ShaftElement:
             odr = odl
             if "odl" in is_random and "odr" not in is_random:
                 is_random.append("odr")
-        if isinstance(material, ST_Material):
-            material = list(iter(material))
-
         attribute_dict = dict(
             L=L,
             idl=idl,
@@ -150,6 +153,42 @@ class ST_ShaftElement:
         """
         return iter(self.random_var(self.is_random, self.attribute_dict))
 
+    def map(self, func, workers=1):
+        """Apply a function to each random shaft element.
+
+        The samples are independent of each other, so they can be evaluated
+        in parallel.
+
+        Parameters
+        ----------
+        func : callable
+            Function called with each random ross.ShaftElement.
+            If workers > 1, func must be picklable (e.g. a module level function).
+        workers : int, optional
+            Number of processes used to evaluate func. Default is 1, which
+            evaluates the samples sequentially in the current process.
+
+        Returns
+        -------
+        results : list
+            Value returned by func for each random shaft element, in the same
+            order as the elements.
+
+        Examples
+        --------
+        >>> import ross.stochastic as srs
+        >>> elm = srs.st_shaft_example()
+        >>> elm.map(lambda shaft: shaft.L)
+        [1.0, 1.1]
+        """
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(func, iter(self)))
+        else:
+            results = [func(elm) for elm in iter(self)]
+
+        return results
+
     def __getitem__(self, key):
         """Return the value for a given key from attribute_dict.
 
@@ -172,11 +211,12 @@ class ST_ShaftElement:
         >>> import numpy as np
         >>> import ross.stochastic as srs
         >>> size = 5
-        >>> E = np.random.uniform(208e9, 211e9, size)
+        >>> rng = np.random.default_rng()
+        >>> E = rng.uniform(208e9, 211e9, size)
         >>> st_steel = srs.ST_Material(name="Steel", rho=7810, E=E, G_s=81.2e9)
         >>> elms = srs.ST_ShaftElement(L=1,
         ...                            idl=0,
-        ...                            odl=np.random.uniform(0.1, 0.2, size),
+        ...                            odl=rng.uniform(0.1, 0.2, size),
         ...                            material=st_steel,
         ...                            is_random=["odl", "material"],
         ...                            )
@@ -212,11 +252,12 @@ class ST_ShaftElement:
         >>> import numpy as np
         >>> import ross.stochastic as srs
         >>> size = 5
-        >>> E = np.random.uniform(208e9, 211e9, size)
+        >>> rng = np.random.default_rng()
+        >>> E = rng.uniform(208e9, 211e9, size)
         >>> st_steel = srs.ST_Material(name="Steel", rho=7810, E=E, G_s=81.2e9)
         >>> elms = srs.ST_ShaftElement(L=1,
         ...                            idl=0,
-        ...                            odl=np.random.uniform(0.1, 0.2, size),
+        ...                            odl=rng.uniform(0.1, 0.2, size),
         ...                            material=st_steel,
         ...                            is_random=["odl", "material"],
         ...                            )
@@ -249,16 +290,12 @@ class ST_ShaftElement:
             Generator of random objects.
         """
         args_dict = args[0]
-        new_args = []
-        for i in range(len(args_dict[is_random[0]])):
-            arg = []
-            for key, value in args_dict.items():
-                if key in is_random:
-                    arg.append(value[i])
-                else:
-                    arg.append(value)
-            new_args.append(arg)
-        f_list = (ShaftElement(*arg) for arg in new_args)
+        fixed_args = {k: v for k, v in args_dict.items() if k not in is_random}
+        random_args = [args_dict[k] for k in is_random]
+        f_list = (
+            ShaftElement(**fixed_args, **dict(zip(is_random, values)))
+            for values in zip(*random_args)
+        )
 
         return f_list
 
@@ -301,9 +338,7 @@ class ST_ShaftElement:
             idr="Right inner diameter",
             odr="Right outer diameter",
         )
-        is_random = self.is_random
-        if "material" in is_random:
-            is_random.remove("material")
+        is_random = [var for var in self.is_random if var != "material"]
 
         if var_list is None:
             var_list = is_random
@@ -8,10 +8,8 @@ from ross.fluid_flow.cylindrical import THDCylindrical
 from ross.units import Q_
 
 
-@pytest.fixture
-def cylindrical():
-
-    bearing = THDCylindrical(
+def _bearing(**kwargs):
+    parameters = dict(
         axial_length=0.263144,
         journal_radius=0.2,
         radial_clearance=1.95e-4,
@@ -36,6 +34,15 @@ def cylindrical():
         print_progress=False,
         print_time=False,
     )
+    parameters.update(kwargs)
+
+    return THDCylindrical(**parameters)
+
+
+@pytest.fixture
+def cylindrical():
+
+    bearing = _bearing()
 
     return bearing
 
@@ -43,34 +50,7 @@ def cylindrical():
 @pytest.fixture
 def cylindrical_units():
 
-    speed = Q_([900], "RPM")
-    L = Q_(10.3600055944, "in")
-
-    bearing = THDCylindrical(
-        axial_length=L,
-        journal_radius=0.2,
-        radial_clearance=1.95e-4,
-        elements_circumferential=11,
-        elements_axial=3,
-        n_y=None,
-        n_pad=2,
-        pad_arc_length=176,
-        reference_temperature=50,
-        reference_viscosity=0.02,
-        speed=speed,
-        load_x_direction=0,
-        load_y_direction=-112814.91,
-        groove_factor=[0.52, 0.48],
-        lubricant="ISOVG32",
-        node=3,
-        sommerfeld_type=2,
-        initial_guess=[0.1, -0.1],
-        method="perturbation",
-        show_coef=False,
-        print_result=True,
-        print_progress=False,
-        print_time=False,
-    )
+    bearing = _bearing(axial_length=Q_(10.3600055944, "in"))
 
     return bearing
 
@@ -115,3 +95,27 @@ def test_cylindrical_coefficients(cylindrical):
     assert math.isclose(cxy, -5694003570.762247, rel_tol=0.0001)
     assert math.isclose(cyx, -17098739.35960476, rel_tol=0.0001)
     assert math.isclose(cyy, 6552334.408698953, rel_tol=0.0001)
+
+
+@pytest.mark.parametrize("method", ["dogbox", "Nelder-Mead"])
+def test_cylindrical_equilibrium_method(method):
+    bearing = _bearing(equilibrium_method=method)
+
+    assert_allclose(bearing.equilibrium_pos, [0.60678516, -0.73288691], rtol=1e-4)
+
+
+def test_cylindrical_equilibrium_method_without_bounds():
+    with pytest.raises(ValueError, match="BFGS can not be used"):
+        _bearing(equilibrium_method="BFGS")
+
+
+def test_cylindrical_equilibrium_not_converged():
+    with pytest.warns(UserWarning, match="did not converge"):
+        _bearing(load_y_direction=-1.5e6)
+
+
+def test_cylindrical_workers(cylindrical):
+    bearing = _bearing(workers=2)
+
+    assert_allclose(bearing.coefficients(), cylindrical.coefficients(), rtol=1e-12)
+    assert_allclose(bearing.Pdim, cylindrical.Pdim, rtol=1e-12)
@@ -9,6 +9,7 @@ import numpy as np
 import pytest
 from plotly import graph_objects as go
 
+from ross.materials import steel
 from ross.stochastic.st_bearing_seal_element import ST_BearingElement
 from ross.stochastic.st_disk_element import ST_DiskElement
 from ross.stochastic.st_materials import ST_Material
@@ -172,6 +173,40 @@ def test_st_point_mass(rand_point_mass):
     assert [pm.my for pm in elm] == [3.0, 3.5]
 
 
+def _shaft_mass(shaft):
+    return shaft.m
+
+
+def test_st_shaft_element_map(rand_shaft):
+    serial = rand_shaft.map(_shaft_mass)
+    assert serial == [sh.m for sh in iter(rand_shaft)]
+    assert rand_shaft.map(_shaft_mass, workers=2) == serial
+
+
+def test_st_shaft_is_random_not_mutated():
+    is_random = ["idl", "odl"]
+    elms = [
+        ST_ShaftElement(
+            L=1.0, idl=[0.01, 0.02], odl=[0.1, 0.2], material=steel, is_random=is_random
+        )
+        for _ in range(2)
+    ]
+    assert is_random == ["idl", "odl"]
+    for elm in elms:
+        assert elm.is_random == ["idl", "odl", "idr", "odr"]
+
+
+def test_st_bearing_is_random_not_mutated():
+    is_random = ["kxx", "cxx"]
+    elms = [
+        ST_BearingElement(n=1, kxx=[1e6, 2e6], cxx=[1e3, 2e3], is_random=is_random)
+        for _ in range(2)
+    ]
+    assert is_random == ["kxx", "cxx"]
+    for elm in elms:
+        assert elm.is_random == ["kxx", "cxx", "kyy", "cyy"]
+
+
 ###############################################################################
 # testing error messages
 ###############################################################################
@@ -269,3 +304,10 @@ def test_element_stats_plot(
 
     fig = rand_point_mass.plot_random_var(["mx"])
     assert type(fig) == figure_type
+
+
+def test_st_shaft_plot_keeps_material(rand_shaft):
+    rand_shaft.plot_random_var(["L"])
+    assert "material" in rand_shaft.is_random
+    elm = list(iter(rand_shaft))
+    assert [sh.material.E for sh in elm] == [209000000000.0, 211000000000.0]